@@ -323,9 +323,9 @@ class CommandHandler:
             if self.dodocker_path.exists():
                 with open(self.dodocker_path, "r") as f:
                     existing_commands = {
-                        line.strip()
-                        for line in f
-                        if line.strip() and not line.startswith("#")
+                        line
+                        for line in map(str.strip, f)
+                        if line and not line.startswith("#")
                     }
 
             # Add new command if not already present
@@ -354,9 +354,9 @@ class CommandHandler:
             if self.doignore_path.exists():
                 with open(self.doignore_path, "r") as f:
                     existing_ignores = {
-                        line.strip()
-                        for line in f
-                        if line.strip() and not line.startswith("#")
+                        line
+                        for line in map(str.strip, f)
+                        if line and not line.startswith("#")
                     }
 
             # Add new ignore if not already present
@@ -489,9 +489,9 @@ class CommandHandler:
         if self.doignore_path.exists():
             with open(self.doignore_path, "r") as f:
                 existing_ignores = {
-                    line.strip()
-                    for line in f
-                    if line.strip() and not line.startswith("#")
+                    line
+                    for line in map(str.strip, f)
+                    if line and not line.startswith("#")
                 }
 
         new_commands = [cmd for cmd in commands if cmd not in existing_ignores]
@@ -578,9 +578,9 @@ class CommandHandler:
                 if self.doignore_path.exists():
                     with open(self.doignore_path, "r") as f:
                         existing_commands = {
-                            line.strip()
-                            for line in f
-                            if line.strip() and not line.startswith("#")
+                            line
+                            for line in map(str.strip, f)
+                            if line and not line.startswith("#")
                         }
 
                 # Only add new failing commands that aren't already in .doignore
@@ -85,9 +85,9 @@ class ConfigFileHandler:
         try:
             with open(self.ignore_file, "r", encoding="utf-8") as f:
                 patterns = [
-                    line.strip()
-                    for line in f
-                    if line.strip() and not line.startswith("#")
+                    line
+                    for line in map(str.strip, f)
+                    if line and not line.startswith("#")
                 ]
                 self.exclude_patterns.update(patterns)
                 logger.info(
@@ -1,7 +1,7 @@
 """Command class for representing executable commands."""
 
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Tuple
 
 
 @dataclass
@@ -38,6 +38,34 @@ class Command:
             "metadata": self.metadata,
         }
 
+    def to_report_dict(
+        self, result_fields: Iterable[Tuple[str, Any]] = ()
+    ) -> Dict[str, Any]:
+        """Convert the command and its execution results to a dictionary.
+
+        Result attributes (``success``, ``stdout``, ...) are attached to the
+        command when it is run; missing ones are looked up in ``metadata``
+        and otherwise filled with their default.
+
+        Args:
+            result_fields: Pairs of result attribute name and default value
+                (None means the field is only included when it is set)
+
+        Returns:
+            A dictionary with the command fields and its results.
+        """
+        data = self.to_dict()
+        attrs = vars(self)
+        metadata = self.metadata if isinstance(self.metadata, dict) else None
+        for name, default in result_fields:
+            if name in attrs:
+                data[name] = attrs[name]
+            elif default is not None:
+                data[name] = (
+                    metadata.get(name, default) if metadata is not None else default
+                )
+        return data
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Command":
         """Create a Command from a dictionary.
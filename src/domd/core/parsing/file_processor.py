@@ -3,12 +3,15 @@
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 from .pattern_matcher import PatternMatcher
 
 logger = logging.getLogger(__name__)
 
+# Characters that make a file pattern a glob rather than a plain substring
+_GLOB_CHARS = frozenset("*?[")
+
 
 class FileProcessor:
     """Handles finding and processing configuration files in a project."""
@@ -91,15 +94,31 @@ class FileProcessor:
 
         found_files = set()
 
+        # Compile each pattern set once for the whole walk
+        is_excluded = self._compile_matcher(all_exclude)
+        is_included = self._compile_matcher(include)
+        # Plain directory names are excluded by substring match, so they can
+        # be pruned by name before any pattern is tried
+        excluded_names = frozenset(
+            pattern
+            for pattern in all_exclude
+            if not pattern.startswith("re:") and not _GLOB_CHARS.intersection(pattern)
+        )
+
+        root_str = str(self.project_root)
+        root_prefix_len = len(os.path.join(root_str, ""))
+
         # Walk the directory tree
-        for root, dirs, files in os.walk(
-            self.project_root, followlinks=self.follow_links
-        ):
-            # Skip excluded directories
-            rel_root = Path(root).relative_to(self.project_root)
+        for root, dirs, files in os.walk(root_str, followlinks=self.follow_links):
+            # Relative prefix of the current directory ("" at the root)
+            rel_root = root[root_prefix_len:]
+            prefix = rel_root + os.sep if rel_root else ""
 
             # Check directory depth
-            if max_depth is not None and len(rel_root.parts) >= max_depth:
+            if (
+                max_depth is not None
+                and (rel_root.count(os.sep) + 1 if rel_root else 0) >= max_depth
+            ):
                 del dirs[:]  # Don't recurse deeper
                 continue
 
@@ -107,25 +126,34 @@ class FileProcessor:
             dirs[:] = [
                 d
                 for d in dirs
-                if not self.matcher.match_file(
-                    str(rel_root / d) + "/", all_exclude, default=False
-                )
+                if d not in excluded_names and not is_excluded(f"{prefix}{d}/")
             ]
 
             # Process files in current directory
             for file_name in files:
-                file_path = rel_root / file_name
+                file_path = prefix + file_name
 
-                # Skip excluded files
-                if self.matcher.match_file(str(file_path), all_exclude, default=False):
-                    continue
-
-                # Check if file matches include patterns
-                if self.matcher.match_file(str(file_path), include, default=False):
+                # Skip excluded files, keep those matching the include patterns
+                if not is_excluded(file_path) and is_included(file_path):
                     found_files.add(self.project_root / file_path)
 
         return sorted(found_files)
 
+    def _compile_matcher(self, patterns: Iterable[str]) -> Callable[[str], bool]:
+        """Build a predicate checking a relative path against file patterns.
+
+        Args:
+            patterns: File patterns, as accepted by ``PatternMatcher.match_file``
+
+        Returns:
+            Function returning True if a path matches any of the patterns
+        """
+        patterns = list(patterns)
+        regex = self.matcher.compile_file_patterns(patterns)
+        if regex is not None:
+            return lambda path: regex.match(path) is not None
+        return lambda path: self.matcher.match_file(path, patterns, default=False)
+
     def find_files(
         self,
         patterns: Optional[Iterable[str]] = None,
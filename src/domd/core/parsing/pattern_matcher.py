@@ -4,10 +4,22 @@ import fnmatch
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Pattern, Union
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Group references (backreferences and conditionals) in a regex pattern
+_GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Global inline flags such as "(?i)" at the start of a regex pattern
+_GLOBAL_FLAGS_RE = re.compile(r"(?:\(\?[aiLmsux]+\))+")
+
+# Number of compiled file pattern lists kept per matcher, see match_file
+FILE_PATTERN_CACHE_SIZE = 256
+
+# Start of an "npm run" command, up to its script name (see match_command)
+_NPM_RUN_SCRIPT = r"npm run (?=(?s:.*?)\S)"
+
 
 class PatternMatcher:
     """Handles pattern matching for files and commands."""
@@ -20,6 +32,7 @@ class PatternMatcher:
         """
         self.case_sensitive = case_sensitive
         self._compiled_patterns: Dict[str, Pattern] = {}
+        self._compiled_file_sets: Dict[tuple, Optional[Pattern]] = {}
 
     def match_file(
         self,
@@ -45,6 +58,20 @@ class PatternMatcher:
 
         file_path = str(file_path)
 
+        # Pattern lists are usually reused for many files, so match against
+        # one regex compiled per distinct list
+        key = (self.case_sensitive, tuple(patterns))
+        cache = self._compiled_file_sets
+        try:
+            regex = cache[key]
+        except KeyError:
+            regex = self.compile_file_patterns(key[1])
+            if len(cache) >= FILE_PATTERN_CACHE_SIZE:
+                cache.clear()
+            cache[key] = regex
+        if regex is not None:
+            return regex.match(file_path) is not None
+
         for pattern in patterns:
             # Handle directory patterns with trailing /*
             if pattern.endswith("/*"):
@@ -147,6 +174,158 @@ class PatternMatcher:
 
         return False
 
+    def compile_command_patterns(
+        self, patterns: List[str]
+    ) -> Optional[Tuple[Pattern, ...]]:
+        """Compile command patterns into as few regexes as possible.
+
+        The resulting regexes reproduce the semantics of :meth:`match_command`
+        (glob, ``re:`` and substring patterns) so a command can be checked
+        against all patterns with one ``match()`` call in most cases. ``re:``
+        patterns referring back to their own groups or starting with global
+        flags such as ``(?i)`` are compiled on their own, since joining them
+        into one alternation would renumber the groups or is not allowed.
+
+        Args:
+            patterns: List of patterns to compile
+
+        Returns:
+            Tuple of compiled regexes for :meth:`match_compiled_command`, or
+            None if there are no usable patterns or they cannot be combined
+        """
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        alternatives = []
+        separate = []
+        for pattern in patterns:
+            if not pattern:
+                continue
+
+            # match_command lowercases the patterns as well as the command
+            if not self.case_sensitive:
+                pattern = pattern.lower()
+
+            if pattern.startswith("re:"):
+                body = pattern[3:]
+                try:
+                    re.compile(body, flags)
+                except re.error as e:
+                    logger.warning("Invalid regex pattern '%s': %s", body, e)
+                    continue
+
+                global_flags = _GLOBAL_FLAGS_RE.match(body)
+                if global_flags:
+                    # Global flags must stay at the start of the regex, so
+                    # the pattern cannot join the alternation
+                    body = body[global_flags.end() :]
+                    end = "\n)" if "x" in global_flags.group() else ")"
+                    source = f"{global_flags.group()}(?s:.*?)(?:{body}{end}"
+                else:
+                    source = f"(?s:.*?)(?:{body})"
+                try:
+                    regex = re.compile(source, flags)
+                except re.error:
+                    # Let the caller fall back to match_command
+                    return None
+
+                if global_flags or (regex.groups and _GROUP_REFERENCE_RE.search(body)):
+                    separate.append(regex)
+                else:
+                    alternatives.append(source)
+            elif "*" in pattern or "?" in pattern or "[" in pattern:
+                glob = fnmatch.translate(pattern)
+                alternatives.append(glob)
+                # Globs are also matched against the script name of "npm run"
+                alternatives.append(f"{_NPM_RUN_SCRIPT}(?:{glob})")
+            else:
+                # A substring of the npm script name is one of the command too
+                alternatives.append(f"(?s:.*?){re.escape(pattern)}")
+
+        combined = self._combine_alternatives(alternatives, flags)
+        if combined is None and alternatives:
+            return None
+        regexes = tuple(separate) if combined is None else (combined, *separate)
+        return regexes or None
+
+    def compile_file_patterns(self, patterns: Iterable[str]) -> Optional[Pattern]:
+        """Compile file patterns into a single alternation regex.
+
+        The resulting regex reproduces the semantics of :meth:`match_file`
+        (``dir/*`` prefixes, ``re:``, glob and substring patterns) so a path
+        can be checked against all patterns with one ``match()`` call.
+
+        Args:
+            patterns: List of patterns to compile
+
+        Returns:
+            Compiled regex, or None if there are no usable patterns or a
+            ``re:`` pattern cannot be part of a combined regex, in which case
+            the patterns are matched one by one
+        """
+        alternatives = []
+        for pattern in patterns:
+            if pattern.endswith("/*"):
+                alternatives.append(f"(?s:{re.escape(pattern[:-2])}/.*)")
+            elif pattern.startswith("re:"):
+                body = pattern[3:]
+                try:
+                    re.compile(body)
+                except re.error as e:
+                    logger.warning("Invalid regex pattern '%s': %s", body, e)
+                    continue
+                # Joining would renumber the groups a backreference refers to,
+                # and global flags are only allowed at the start of a regex
+                if _GROUP_REFERENCE_RE.search(body) or _GLOBAL_FLAGS_RE.match(body):
+                    return None
+                case_flag = "" if self.case_sensitive else "i"
+                alternatives.append(f"(?{case_flag}:^(?:{body})$)")
+            elif "*" in pattern or "?" in pattern or "[" in pattern:
+                alternatives.append(fnmatch.translate(pattern))
+            else:
+                alternatives.append(f"(?s:.*?){re.escape(pattern)}")
+
+        return self._combine_alternatives(alternatives)
+
+    def _combine_alternatives(
+        self, alternatives: List[str], flags: int = 0
+    ) -> Optional[Pattern]:
+        """Join regex alternatives into one compiled pattern.
+
+        Args:
+            alternatives: Regex sources to combine
+            flags: Regex flags for the combined pattern
+
+        Returns:
+            Compiled regex, or None if there is nothing to combine or the
+            alternatives cannot be combined
+        """
+        if not alternatives:
+            return None
+
+        try:
+            return re.compile(
+                "|".join(f"(?:{alternative})" for alternative in alternatives), flags
+            )
+        except re.error as e:
+            logger.warning("Could not combine patterns: %s", e)
+            return None
+
+    def match_compiled_command(
+        self, command: str, regexes: Tuple[Pattern, ...]
+    ) -> bool:
+        """Check a command against regexes from :meth:`compile_command_patterns`.
+
+        Args:
+            command: Command string to check
+            regexes: Compiled pattern regexes
+
+        Returns:
+            bool: True if the command matches, False otherwise
+        """
+        if not self.case_sensitive:
+            command = command.lower()
+
+        return any(regex.match(command) for regex in regexes)
+
     def _compile_regex(self, pattern: str, fullmatch: bool = False) -> Pattern:
         """Compile a regex pattern with caching.
 
@@ -3,8 +3,9 @@
 import logging
 import shlex
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 from domd.command_execution import CommandRunner
 from domd.core.commands import Command
@@ -13,6 +14,9 @@ from domd.utils.path_utils import safe_path_display, to_relative_path
 
 logger = logging.getLogger(__name__)
 
+# Number of command strings whose ignore decision is memoized
+IGNORE_CACHE_SIZE = 8192
+
 
 class CommandHandler:
     """Handler for executing and managing project commands."""
@@ -35,8 +39,8 @@ class CommandHandler:
         self.project_path = project_path
         self.command_runner = command_runner
         self.timeout = timeout
-        self.ignore_patterns = ignore_patterns or []
         self.pattern_matcher = PatternMatcher()
+        self.ignore_patterns = ignore_patterns or []
 
         # Load commands that should be executed in Docker container
         self.docker_commands = {}
@@ -64,11 +68,34 @@ class CommandHandler:
             except Exception as e:
                 logger.error(f"Error loading .dodocker commands: {e}")
 
+        # Compile the Docker command patterns once for should_run_in_docker
+        self._docker_patterns = [
+            cmd for cmd, use_docker in self.docker_commands.items() if use_docker
+        ]
+        self._docker_re = self.pattern_matcher.compile_command_patterns(
+            self._docker_patterns
+        )
+
         # Command storage - może zawierać zarówno obiekty Command jak i słowniki
         self.failed_commands: List[Union[Command, Dict[str, Any]]] = []
         self.successful_commands: List[Union[Command, Dict[str, Any]]] = []
         self.ignored_commands: List[Union[Command, Dict[str, Any]]] = []
 
+    @property
+    def ignore_patterns(self) -> List[str]:
+        """Command patterns that should be ignored."""
+        return self._ignore_patterns
+
+    @ignore_patterns.setter
+    def ignore_patterns(self, patterns: List[str]) -> None:
+        """Set ignore patterns and compile them into a single regex."""
+        self._ignore_patterns = patterns
+        self._ignore_re = self.pattern_matcher.compile_command_patterns(patterns)
+        # Results are memoized per command string until the patterns change
+        self._ignore_lookup = lru_cache(maxsize=IGNORE_CACHE_SIZE)(
+            self._match_ignore_patterns
+        )
+
     def _format_command_result(
         self,
         result: Any,
@@ -221,13 +248,14 @@ class CommandHandler:
             return result_dict
 
     def run_in_venv(
-        self, command: Union[str, List[str]], venv_env: Dict[str, str], **kwargs
+        self, command: Union[str, List[str]], venv_env: Mapping[str, str], **kwargs
     ) -> Dict[str, Any]:
         """Run a command in the virtual environment.
 
         Args:
             command: Command to execute (string or list of arguments)
             venv_env: Environment variables with virtualenv paths included
+                (not modified; a merged copy is passed to the command)
             **kwargs: Additional arguments to pass to execute_command
 
         Returns:
@@ -277,7 +305,7 @@ class CommandHandler:
 
         # Merge environments, with user-provided env taking precedence
         env = kwargs.pop("env", {})
-        merged_env = venv_env.copy()
+        merged_env = dict(venv_env)
         merged_env.update({k: str(v) for k, v in env.items() if v is not None})
 
         # Run the command using the command runner
@@ -306,19 +334,45 @@ class CommandHandler:
         Returns:
             bool: True if command should be ignored
         """
-        # Convert Command object to dict if needed
-        if hasattr(cmd, "to_dict"):
-            cmd_dict = cmd.to_dict()
+        if not self._ignore_patterns:
+            return False
+
+        if isinstance(cmd, dict):
+            command_str = cmd.get("command", "")
         else:
-            cmd_dict = cmd
-
-        # Check ignore patterns using PatternMatcher
-        command_str = cmd_dict.get("command", "")
-        return (
-            self.pattern_matcher.match_command(command_str, self.ignore_patterns)
-            if self.ignore_patterns
-            else False
-        )
+            command_str = getattr(cmd, "command", "")
+        return self.is_ignored_command(command_str)
+
+    def is_ignored_command(self, command_str: str) -> bool:
+        """Check a command string against the ignore patterns.
+
+        Args:
+            command_str: Command string to check
+
+        Returns:
+            bool: True if the command matches an ignore pattern
+        """
+        if not self._ignore_patterns:
+            return False
+        if isinstance(command_str, str):
+            return self._ignore_lookup(command_str)
+        return self._match_ignore_patterns(command_str)
+
+    def _match_ignore_patterns(self, command_str: str) -> bool:
+        """Match a command string against the ignore patterns (uncached).
+
+        Args:
+            command_str: Command string to check
+
+        Returns:
+            bool: True if the command matches an ignore pattern
+        """
+        # Check ignore patterns using the regex compiled when they were set
+        if self._ignore_re is not None:
+            return self.pattern_matcher.match_compiled_command(
+                command_str, self._ignore_re
+            )
+        return self.pattern_matcher.match_command(command_str, self._ignore_patterns)
 
     def should_run_in_docker(self, command: str) -> bool:
         """Check if a command should be run in Docker based on .dodocker file.
@@ -337,10 +391,9 @@ class CommandHandler:
             return self.docker_commands[command]
 
         # Check for pattern match only for commands explicitly marked with docker:
-        docker_patterns = [
-            cmd for cmd, use_docker in self.docker_commands.items() if use_docker
-        ]
-        return self.pattern_matcher.match_command(command, docker_patterns)
+        if self._docker_re is not None:
+            return self.pattern_matcher.match_compiled_command(command, self._docker_re)
+        return self.pattern_matcher.match_command(command, self._docker_patterns)
 
     def execute_single_command(self, cmd_info) -> bool:
         """Execute a single command and update the command info with results.
@@ -351,17 +404,16 @@ class CommandHandler:
         Returns:
             bool: True if command executed successfully, False otherwise
         """
-        if hasattr(cmd_info, "command"):  # It's a Command object
+        is_object = hasattr(cmd_info, "command")
+        if is_object:  # It's a Command object
             command = cmd_info.command
             # Get cwd from metadata if available, otherwise fall back to project_path
-            cwd = (
-                Path(cmd_info.metadata.get("cwd"))
-                if hasattr(cmd_info, "metadata")
-                and hasattr(cmd_info.metadata, "get")
-                and callable(cmd_info.metadata.get)
-                and cmd_info.metadata.get("cwd")
-                else getattr(cmd_info, "cwd", self.project_path)
-            )
+            try:
+                cwd = cmd_info.metadata.get("cwd")
+            except (AttributeError, TypeError):
+                cwd = None
+            if not cwd:
+                cwd = getattr(cmd_info, "cwd", self.project_path)
             timeout = getattr(cmd_info, "timeout", self.timeout)
             env = getattr(cmd_info, "env", None)
         else:  # It's a dictionary
@@ -401,7 +453,7 @@ class CommandHandler:
             )
 
             # Update command info with results
-            if hasattr(cmd_info, "command"):  # Command object
+            if is_object:  # Command object
                 setattr(cmd_info, "execution_time", result.execution_time)
                 setattr(cmd_info, "stdout", result.stdout)
                 setattr(cmd_info, "stderr", result.stderr)
@@ -428,7 +480,7 @@ class CommandHandler:
             error_msg = f"Command timed out after {e.timeout} seconds"
             logger.error(error_msg)
 
-            if hasattr(cmd_info, "command"):  # Command object
+            if is_object:  # Command object
                 setattr(cmd_info, "error", error_msg)
                 setattr(cmd_info, "return_code", -1)
                 setattr(cmd_info, "success", False)
@@ -442,7 +494,7 @@ class CommandHandler:
             error_msg = str(e)
             logger.error("Error executing command '%s': %s", command, error_msg)
 
-            if hasattr(cmd_info, "command"):  # Command object
+            if is_object:  # Command object
                 setattr(cmd_info, "error", str(e))
                 setattr(cmd_info, "success", False)
             else:  # Dictionary
@@ -514,13 +566,10 @@ class CommandHandler:
                         )
 
                     # Preserve the cwd in the output for reference
-                    cwd = (
-                        cmd_copy.metadata.get("cwd")
-                        if hasattr(cmd_copy, "metadata")
-                        and hasattr(cmd_copy.metadata, "get")
-                        and callable(cmd_copy.metadata.get)
-                        else self.project_path
-                    )
+                    try:
+                        cwd = cmd_copy.metadata.get("cwd")
+                    except (AttributeError, TypeError):
+                        cwd = self.project_path
                     if cwd != self.project_path:
                         setattr(cmd_copy, "source", f"{cwd}/{cmd_copy.source}")
 
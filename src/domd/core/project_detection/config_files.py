@@ -1,8 +1,10 @@
 """Configuration file handling for project command detection."""
 
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from domd.parsing import FileProcessor, PatternMatcher
 from domd.parsing.base import BaseParser
@@ -19,6 +21,7 @@ class ConfigFileHandler:
         exclude_patterns: Optional[List[str]] = None,
         include_patterns: Optional[List[str]] = None,
         ignore_file: Optional[Path] = None,
+        reuse_config_files: bool = False,
     ):
         """Initialize the ConfigFileHandler.
 
@@ -27,15 +30,48 @@ class ConfigFileHandler:
             exclude_patterns: List of file patterns to exclude
             include_patterns: List of file patterns to include
             ignore_file: Path to the ignore file
+            reuse_config_files: Reuse the last configuration file search until
+                :meth:`invalidate_scan_cache` is called or the project
+                directory or ignore file changes. Files added in
+                subdirectories are not noticed until then.
         """
         self.project_path = project_path
         self.exclude_patterns = exclude_patterns or []
         self.include_patterns = include_patterns or []
         self.ignore_file = ignore_file
+        self.reuse_config_files = reuse_config_files
 
         self.file_processor = FileProcessor(project_root=project_path)
         self.pattern_matcher = PatternMatcher()
 
+        # Last find_config_files result as (key, files), see reuse_config_files
+        self._config_files_cache: Optional[Tuple[tuple, List[Path]]] = None
+        self._config_files_lock = threading.Lock()
+
+    def invalidate_scan_cache(self) -> None:
+        """Forget the last configuration file search."""
+        with self._config_files_lock:
+            self._config_files_cache = None
+
+    def _config_files_key(self, parsers: List[BaseParser]) -> tuple:
+        """Build the key a configuration file search is cached under.
+
+        Args:
+            parsers: Parser instances used for file detection
+
+        Returns:
+            Tuple of the project directory and ignore file state and the
+            parser classes
+        """
+        stamps = []
+        for path in (self.project_path, self.ignore_file):
+            try:
+                st = os.stat(path) if path else None
+            except OSError:
+                st = None
+            stamps.append((st.st_mtime_ns, st.st_size) if st else None)
+        return (*stamps, tuple(type(parser) for parser in parsers))
+
     def find_config_files(self, parsers: List[BaseParser]) -> List[Path]:
         """Find all configuration files in the project.
 
@@ -45,6 +81,15 @@ class ConfigFileHandler:
         Returns:
             List of Path objects to configuration files
         """
+        key = None
+        if self.reuse_config_files:
+            key = self._config_files_key(parsers)
+            with self._config_files_lock:
+                cached = self._config_files_cache
+            if cached is not None and cached[0] == key:
+                logger.debug("Reusing config files found in: %s", self.project_path)
+                return list(cached[1])
+
         logger.debug(f"Finding config files in: {self.project_path}")
 
         # Build exclude patterns
@@ -67,13 +112,12 @@ class ConfigFileHandler:
 
         # Add patterns from ignore file if it exists
         if self.ignore_file and self.ignore_file.exists():
-            with open(self.ignore_file) as f:
-                ignore_patterns = [
-                    line.strip()
-                    for line in f
-                    if line.strip() and not line.startswith("#")
-                ]
-                exclude_patterns.extend(ignore_patterns)
+            text = self.ignore_file.read_text(encoding="utf-8")
+            exclude_patterns.extend(
+                line
+                for line in map(str.strip, text.splitlines())
+                if line and not line.startswith("#")
+            )
 
         # Use the FileProcessor to find files
         all_files = self.file_processor.find_files(
@@ -89,6 +133,9 @@ class ConfigFileHandler:
                 logger.debug(f"Found config file: {file_path}")
 
         logger.debug(f"Found {len(config_files)} config files")
+        if key is not None:
+            with self._config_files_lock:
+                self._config_files_cache = (key, list(config_files))
         return config_files
 
     def _has_parser_for_file(self, file_path: Path, parsers: List[BaseParser]) -> bool:
@@ -135,13 +182,11 @@ class ConfigFileHandler:
         relative_path = str(file_path.relative_to(self.project_path))
 
         # Check exclude patterns
-        if self.pattern_matcher.match_any_pattern(relative_path, self.exclude_patterns):
+        if self.pattern_matcher.match_file(relative_path, self.exclude_patterns):
             return False
 
         # Check include patterns (if any)
         if self.include_patterns:
-            return self.pattern_matcher.match_any_pattern(
-                relative_path, self.include_patterns
-            )
+            return self.pattern_matcher.match_file(relative_path, self.include_patterns)
 
         return True
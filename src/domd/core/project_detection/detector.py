@@ -1,12 +1,25 @@
 """Project command detector for finding and executing commands in project files."""
 
+import fnmatch
+import inspect
 import logging
+import operator
 import os
+import re
+import stat
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from domd.command_execution import CommandExecutor, CommandRunner
 from domd.core.commands import Command
+from domd.core.parsers.base import BaseParser as _CoreParser
+from domd.core.parsing.base import BaseParser as _CoreParsingParser
 from domd.core.parsing.pattern_matcher import PatternMatcher
 from domd.core.project_detection.command_handling import CommandHandler
 from domd.core.project_detection.config_files import ConfigFileHandler
@@ -17,13 +30,280 @@ from domd.core.project_detection.virtualenv import (
 from domd.parsing import FileProcessor, ParserRegistry
 from domd.parsing.base import BaseParser
 from domd.reporting import MarkdownFormatter, Reporter
+from domd.utils.file_utils import open_for_replace
 
 logger = logging.getLogger(__name__)
 
+# Shared placeholder for report sections that carry no commands
+_NO_COMMANDS: tuple = ()
+
+# Report data used for both reports when no command was run
+_EMPTY_REPORT_DATA = {
+    "commands": _NO_COMMANDS,
+    "failed_commands": _NO_COMMANDS,
+    "successful_commands": _NO_COMMANDS,
+    "ignored_commands": _NO_COMMANDS,
+}
+
+# Per-command blocks of the LLM-oriented TODO.md
+_FAILED_TODO_BLOCK = (
+    "### 🔧 Fix: {command}\n"
+    "- [ ] **Command**: `{command}`  \n"
+    "- **Error**: {error}  \n"
+    "- **Source**: `{source}`\n"
+    "- **Fix Suggestion**: \n\n"
+    "  ```bash\n"
+    "  # Suggested fix\n"
+    "  # Replace with the correct command\n"
+    "  ```\n\n"
+)
+_SUCCESSFUL_TODO_BLOCK = "- [x] `{command}`  \n  - Source: `{source}`\n"
+
+# Fixed preamble of the generated fix script
+_SCRIPT_HEADER = (
+    "#!/bin/bash\n"
+    "# Auto-generated script to fix failed commands\n"
+    "# Generated by domd\n"
+    "\n"
+    "set -e\n"
+)
+
+# Directory names that are never scanned for configuration files
+_EXCLUDED_DIR_NAMES = frozenset({"node_modules", "venv", ".venv", "env", "__pycache__"})
+
+# Number of file contents kept for parsers that are handed the content
+CONTENT_CACHE_SIZE = 64
+# Number of parser lookups remembered per detector, keyed by file state
+PARSER_CACHE_SIZE = 512
+# Files larger than this (e.g. lockfiles) are read on demand but not cached
+CONTENT_CACHE_MAX_FILE_SIZE = 256 * 1024
+
+# Upper bound for the threads parsing files during a scan (parsing is mostly
+# file I/O, so more threads than CPUs pay off)
+_MAX_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Positional Command fields read from parsed command dictionaries
+_COMMAND_DEFAULTS = {
+    "command": "",
+    "type": "",
+    "description": "",
+    "source": "",
+    "file": "",
+}
+_command_fields = operator.itemgetter(*_COMMAND_DEFAULTS)
+
+# Result attributes copied from Command objects into dictionaries, paired
+# with the default used when neither the command nor its metadata has a
+# value (None means the field is only copied when the attribute is set)
+_RESULT_FIELDS = (
+    ("success", None),
+    ("return_code", None),
+    ("error", None),
+    ("execution_time", None),
+    ("stdout", None),
+    ("stderr", None),
+)
+_FAILED_REPORT_FIELDS = (
+    ("return_code", -1),
+    ("error", ""),
+    ("execution_time", 0),
+    ("success", None),
+    ("stdout", None),
+    ("stderr", None),
+)
+_SUCCESSFUL_REPORT_FIELDS = (
+    ("execution_time", 0),
+    ("success", None),
+    ("stdout", None),
+)
+
+
+def _safe_stat(path: Union[str, Path]) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it cannot be accessed.
+
+    Args:
+        path: Path to stat
+
+    Returns:
+        The stat result or None if the path is missing or cannot be accessed
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _stat_regular(path: Union[str, Path]) -> Optional[os.stat_result]:
+    """Stat a path, returning None unless it is an existing regular file.
+
+    Args:
+        path: Path to stat
+
+    Returns:
+        The stat result or None if the path is missing or not a regular file
+    """
+    st = _safe_stat(path)
+    return st if st is not None and stat.S_ISREG(st.st_mode) else None
+
+
+def _command_to_dict(
+    cmd: Union[Command, Dict[str, Any]], fields: tuple = _RESULT_FIELDS
+) -> Dict[str, Any]:
+    """Convert a tested command to a dictionary including its results.
+
+    Args:
+        cmd: Command object or command dictionary
+        fields: Pairs of result attribute name and default value
+
+    Returns:
+        Command dictionary (dictionaries are returned unchanged)
+    """
+    if isinstance(cmd, dict):
+        return cmd
+
+    if isinstance(cmd, Command):
+        return cmd.to_report_dict(fields)
+
+    cmd_dict = cmd.to_dict()
+    metadata = getattr(cmd, "metadata", None)
+    if not isinstance(metadata, dict):
+        metadata = None
+
+    for field, default in fields:
+        try:
+            cmd_dict[field] = getattr(cmd, field)
+        except AttributeError:
+            if default is not None:
+                cmd_dict[field] = (
+                    metadata.get(field, default) if metadata is not None else default
+                )
+    return cmd_dict
+
+
+def _write_report_file(output: Tuple[Path, str]) -> None:
+    """Write one generated report file, replacing it atomically.
+
+    Args:
+        output: Pair of target path and file content
+    """
+    path, content = output
+    # Encode the whole report in one pass instead of through a text wrapper
+    with open_for_replace(path, binary=True) as f:
+        f.write(content.encode("utf-8"))
+
+
+# can_parse implementations that only match supported_file_patterns against
+# the path, so the file name alone rules a parser in or out
+_PATTERN_CAN_PARSE = frozenset(
+    {_CoreParser.can_parse.__func__, _CoreParsingParser.can_parse.__func__}
+)
+
+
+def _parser_name_filter(parser: Any) -> Optional[re.Pattern]:
+    """Build a regex of file names a parser could possibly accept.
+
+    Args:
+        parser: Parser instance
+
+    Returns:
+        Regex matched against ``path.name``, or None if the parser must
+        always be asked through ``can_parse``
+    """
+    can_parse = getattr(type(parser), "can_parse", None)
+    if getattr(can_parse, "__func__", None) not in _PATTERN_CAN_PARSE:
+        return None
+    try:
+        patterns = list(parser.supported_file_patterns)
+    except Exception:
+        return None
+    if not patterns:
+        return None
+    # Path.match() compares patterns from the right, so the last component
+    # of each pattern has to match the file name
+    return re.compile(
+        "|".join(fnmatch.translate(p.rsplit("/", 1)[-1]) for p in patterns)
+    )
+
+
+# Calling convention per parser class, shared by all detectors
+_CALL_MODES_BY_TYPE: "weakref.WeakKeyDictionary[type, Optional[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _parser_call_mode(parser: Any) -> Optional[str]:
+    """Work out how a parser has to be called, reusing the answer per class.
+
+    Parsers with ``parse``/``parse_file`` set on the instance itself are
+    inspected every time, since their class does not describe them.
+
+    Args:
+        parser: Parser instance
+
+    Returns:
+        ``"parse_file"``, ``"parse_zero"``, ``"parse_path"`` or
+        ``"parse_content"``, or None if the parser cannot parse at all
+    """
+    instance_attrs = getattr(parser, "__dict__", None) or {}
+    if "parse" in instance_attrs or "parse_file" in instance_attrs:
+        return _inspect_call_mode(parser)
+
+    parser_type = type(parser)
+    try:
+        return _CALL_MODES_BY_TYPE[parser_type]
+    except KeyError:
+        mode = _CALL_MODES_BY_TYPE[parser_type] = _inspect_call_mode(parser)
+        return mode
+
+
+def _inspect_call_mode(parser: Any) -> Optional[str]:
+    """Work out how a parser has to be called to parse a file.
+
+    Args:
+        parser: Parser instance
+
+    Returns:
+        ``"parse_file"``, ``"parse_zero"``, ``"parse_path"`` or
+        ``"parse_content"``, or None if the parser cannot parse at all
+    """
+    if callable(getattr(parser, "parse_file", None)):
+        return "parse_file"
+
+    parse = getattr(parser, "parse", None)
+    if not callable(parse):
+        return None
+
+    try:
+        parameters = inspect.signature(parse).parameters.values()
+    except (TypeError, ValueError):
+        return "parse_zero"
+
+    required = [
+        param
+        for param in parameters
+        if param.default is param.empty
+        and param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+    ]
+    if not required:
+        return "parse_zero"
+    if len(required) == 1 and "content" in required[0].name:
+        return "parse_content"
+    return "parse_path"
+
+
+def _call(task):
+    """Invoke a zero-argument callable (used with ``Executor.map``)."""
+    return task()
+
 
 class ProjectCommandDetector:
     """Detects and executes commands in project configuration files."""
 
+    # Parser classes found by the first detector in the process. Every
+    # detector still creates its own parser instances from them.
+    _discovered_parser_classes: Optional[List[type]] = None
+    _legacy_parser_classes: Optional[List[type]] = None
+
     def __init__(
         self,
         project_path: Union[str, Path] = ".",
@@ -35,6 +315,7 @@ class ProjectCommandDetector:
         script_file: Union[str, Path] = "todo.sh",
         ignore_file: str = ".doignore",
         venv_path: Optional[str] = None,
+        reuse_config_files: bool = False,
     ):
         """Initialize the project command detector.
 
@@ -48,22 +329,28 @@ class ProjectCommandDetector:
             script_file: Path to the script file
             ignore_file: Path to the ignore file
             venv_path: Path to the virtual environment
+            reuse_config_files: Reuse the last configuration file search
+                (see :class:`ConfigFileHandler`); files added in
+                subdirectories are not noticed until the cache is invalidated
         """
         self.project_path = Path(project_path).resolve()
+        # Project root with a trailing separator, for cheap relative paths
+        root_str = str(self.project_path)
+        self._root_str = root_str if root_str.endswith(os.sep) else root_str + os.sep
         self.timeout = timeout
         self.exclude_patterns = exclude_patterns or []
         self.include_patterns = include_patterns or []
 
-        # Resolve file paths relative to project_path
-        self.todo_file = (self.project_path / Path(todo_file)).resolve()
-        self.done_file = (self.project_path / Path(done_file)).resolve()
-        self.script_file = (self.project_path / Path(script_file)).resolve()
+        # Resolve file paths relative to project_path; the root is already
+        # canonical, so normalizing the joined path is enough
+        self.todo_file = Path(os.path.normpath(os.path.join(root_str, todo_file)))
+        self.done_file = Path(os.path.normpath(os.path.join(root_str, done_file)))
+        self.script_file = Path(os.path.normpath(os.path.join(root_str, script_file)))
         # Store ignore_file as a Path object relative to project_path
         self.ignore_file = self.project_path / Path(ignore_file)
 
-        # Initialize virtual environment
+        # Initialize virtual environment (also resolves venv_info)
         self.venv_path = venv_path
-        self.venv_info = get_virtualenv_info(venv_path or self.project_path)
 
         # Command ignore patterns (separate from file exclude patterns)
         self.ignore_patterns = []
@@ -84,12 +371,26 @@ class ProjectCommandDetector:
         self.file_processor = FileProcessor(project_root=self.project_path)
         self.pattern_matcher = PatternMatcher()
 
+        # Directory-style exclude patterns ("dir/", "dir/*", "dir/**") prune
+        # whole directories during the README scan
+        dir_patterns = [
+            pattern.rstrip("*").rstrip("/")
+            for pattern in self.exclude_patterns
+            if pattern.endswith(("/", "/*", "/**"))
+        ]
+        self._excluded_dir_re = (
+            re.compile("|".join(fnmatch.translate(p) for p in dir_patterns))
+            if dir_patterns
+            else None
+        )
+
         # Initialize handlers
         self.config_handler = ConfigFileHandler(
             project_path=self.project_path,
             exclude_patterns=self.exclude_patterns,
             include_patterns=self.include_patterns,
             ignore_file=self.ignore_file,
+            reuse_config_files=reuse_config_files,
         )
         self.command_handler = CommandHandler(
             project_path=self.project_path,
@@ -100,6 +401,18 @@ class ProjectCommandDetector:
 
         # Initialize parsers
         self.parsers = self._initialize_parsers()
+        # File name -> candidate parsers, built lazily for self.parsers
+        self._indexed_parsers: Optional[List[BaseParser]] = None
+        self._parser_name_filters: List[tuple] = []
+        self._parsers_by_name: Dict[str, tuple] = {}
+        # Parser chosen per (path, mtime_ns, size), see _find_parser
+        self._parser_cache: "OrderedDict[tuple, Optional[BaseParser]]" = OrderedDict()
+        self._parser_cache_lock = threading.Lock()
+        # Recently read file contents keyed by (path, mtime_ns, size)
+        self._content_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._content_cache_lock = threading.Lock()
+        # Per-parser locks guarding shared parser state during parallel scans
+        self._parser_locks: Dict[int, threading.Lock] = {}
 
         # Command storage (references to command_handler storage)
         self.failed_commands = self.command_handler.failed_commands
@@ -117,13 +430,23 @@ class ProjectCommandDetector:
         """
         logger.debug("Starting parser initialization...")
 
-        # Discover parsers from the domd.core.parsers package
-        try:
-            logger.debug("Discovering parsers from domd.core.parsers...")
-            self.parser_registry.discover_parsers("domd.core.parsers")
-            logger.debug("Parser discovery completed")
-        except Exception as e:
-            logger.error(f"Failed to discover parsers: {e}", exc_info=True)
+        # Discover parsers from the domd.core.parsers package. The package is
+        # only walked once per process; later detectors reuse the classes.
+        cls = type(self)
+        if cls._discovered_parser_classes is None:
+            try:
+                logger.debug("Discovering parsers from domd.core.parsers...")
+                self.parser_registry.discover_parsers("domd.core.parsers")
+                logger.debug("Parser discovery completed")
+                cls._discovered_parser_classes = [
+                    self.parser_registry.get_parser_class(name)
+                    for name in self.parser_registry.get_parser_names()
+                ]
+            except Exception as e:
+                logger.error(f"Failed to discover parsers: {e}", exc_info=True)
+        else:
+            for parser_class in cls._discovered_parser_classes:
+                self.parser_registry.register(parser_class)
 
         # Get all parsers from the registry
         parsers = self.parser_registry.get_all_parsers()
@@ -139,10 +462,12 @@ class ProjectCommandDetector:
 
             # Fallback to legacy parsers if needed
             try:
-                logger.debug("Attempting to use legacy parser import...")
-                from domd.parsers import get_all_parsers
+                if cls._legacy_parser_classes is None:
+                    logger.debug("Attempting to use legacy parser import...")
+                    from domd.parsers import get_all_parsers
 
-                parser_classes = get_all_parsers()
+                    cls._legacy_parser_classes = get_all_parsers()
+                parser_classes = cls._legacy_parser_classes
                 logger.debug(f"Found {len(parser_classes)} legacy parser classes")
 
                 # Create parser instances instead of using classes directly
@@ -207,6 +532,133 @@ class ProjectCommandDetector:
 
         return True
 
+    def _relpath_str(self, path: Union[str, Path]) -> Optional[str]:
+        """Get a path relative to the project root as a string.
+
+        Uses a string prefix check instead of ``Path.relative_to`` to avoid
+        building intermediate path objects.
+
+        Args:
+            path: Absolute path inside the project
+
+        Returns:
+            Relative path string, or None if the path is outside the project
+        """
+        path_str = os.fspath(path)
+        if path_str.startswith(self._root_str):
+            return path_str[len(self._root_str) :]
+        return None
+
+    def _candidate_parsers(self, name: str) -> tuple:
+        """Get the parsers that may handle a file with the given name.
+
+        Results are memoized per file name and reset whenever ``self.parsers``
+        is replaced; parsers with custom ``can_parse`` logic are always
+        included.
+
+        Args:
+            name: File name (``path.name``)
+
+        Returns:
+            Tuple of parsers in order of preference
+        """
+        parsers = self.parsers
+        if parsers is not self._indexed_parsers:
+            # The parser list was replaced, rebuild the dispatch table
+            self._indexed_parsers = parsers
+            self._parser_name_filters = [
+                (parser, _parser_name_filter(parser)) for parser in parsers
+            ]
+            self._parsers_by_name = {}
+            with self._parser_cache_lock:
+                self._parser_cache.clear()
+
+        candidates = self._parsers_by_name.get(name)
+        if candidates is None:
+            candidates = tuple(
+                parser
+                for parser, name_filter in self._parser_name_filters
+                if name_filter is None or name_filter.match(name)
+            )
+            self._parsers_by_name[name] = candidates
+        return candidates
+
+    @property
+    def venv_path(self) -> Optional[str]:
+        """Path to the virtual environment used for running commands."""
+        return self._venv_path
+
+    @venv_path.setter
+    def venv_path(self, value: Optional[str]) -> None:
+        """Set the virtual environment path and drop the cached environment."""
+        self._venv_path = value
+        self.venv_info = get_virtualenv_info(value or self.project_path)
+
+    @property
+    def venv_info(self) -> Dict[str, Any]:
+        """Information about the virtual environment used for running commands."""
+        return self._venv_info
+
+    @venv_info.setter
+    def venv_info(self, value: Dict[str, Any]) -> None:
+        """Set the virtual environment info and drop the cached environment."""
+        self._venv_info = value
+        self.__dict__.pop("_venv_env_base", None)
+
+    def _is_excluded_dir(self, name: str, parent: Optional[str] = None) -> bool:
+        """Check if a directory should not be descended into while scanning.
+
+        Args:
+            name: Directory name
+            parent: Parent directory path relative to the project root, if any
+
+        Returns:
+            True if the directory is hidden, a well-known tool directory or
+            matches a directory-style exclude pattern
+        """
+        if name.startswith(".") or name in _EXCLUDED_DIR_NAMES:
+            return True
+
+        if self._excluded_dir_re is None:
+            return False
+        if self._excluded_dir_re.match(name):
+            return True
+        return bool(parent and self._excluded_dir_re.match(f"{parent}/{name}"))
+
+    def _visible_subdirs(
+        self,
+        directory: Union[str, Path],
+        parent: Optional[str] = None,
+        names: Optional[Set[str]] = None,
+    ) -> List[os.DirEntry]:
+        """List the subdirectories of a directory that should be scanned.
+
+        Entries are filtered while iterating ``os.scandir`` so no ``Path`` is
+        created for skipped entries. Symlinked directories are not followed.
+
+        Args:
+            directory: Directory to list
+            parent: Path of ``directory`` relative to the project root, if it
+                is not the project root itself
+            names: Set that receives the names of all entries in ``directory``
+
+        Returns:
+            Directory entries sorted by name
+        """
+        is_excluded_dir = self._is_excluded_dir
+        with os.scandir(directory) as it:
+            if names is not None:
+                it = list(it)
+                names.update(entry.name for entry in it)
+            entries = [
+                entry
+                for entry in it
+                if not is_excluded_dir(entry.name, parent)
+                and entry.is_dir(follow_symlinks=False)
+            ]
+        entries.sort(key=lambda entry: entry.name)
+        return entries
+
     def _get_environment(self) -> Dict[str, str]:
         """Get environment variables for command execution.
 
@@ -216,7 +668,11 @@ class ProjectCommandDetector:
         return get_virtualenv_environment(self.venv_info)
 
     def _process_directory_readme(
-        self, directory: Path, all_commands: list, parent_dir: str = None
+        self,
+        directory: Path,
+        all_commands: list,
+        parent_dir: str = None,
+        entries: Optional[Set[str]] = None,
     ) -> None:
         """Process a README.md file in a directory and update command metadata.
 
@@ -224,19 +680,22 @@ class ProjectCommandDetector:
             directory: Directory containing the README.md
             all_commands: List to append found commands to
             parent_dir: Name of parent directory (for second-level directories)
+            entries: Names of the entries in ``directory``; when given, the
+                README.md is only looked up if its name is among them
         """
-        logger.debug(f"Checking for README.md in: {directory}")
-        readme_path = directory / "README.md"
-
-        if not readme_path.exists():
-            logger.debug(f"  README.md not found in {directory}")
+        logger.debug("Checking for README.md in: %s", directory)
+        if entries is not None and "README.md" not in entries:
+            logger.debug("  README.md not found in %s", directory)
             return
 
-        if not readme_path.is_file():
-            logger.debug(f"  README.md exists but is not a file in {directory}")
+        readme_path = directory / "README.md"
+
+        readme_stat = _stat_regular(readme_path)
+        if readme_stat is None:
+            logger.debug("  README.md not found or not a file in %s", directory)
             return
 
-        logger.info(f"Found README.md in directory: {directory}")
+        logger.info("Found README.md in directory: %s", directory)
 
         # Determine display path for logging and source
         if parent_dir:
@@ -244,160 +703,243 @@ class ProjectCommandDetector:
         else:
             display_path = f"{directory.name}/README.md"
 
-        logger.info(f"Found README.md: {display_path}")
+        logger.info("Found README.md: %s", display_path)
 
         # Process README.md in directory
-        commands = self._process_file_commands(readme_path)
+        commands = self._process_file_commands(readme_path, file_stat=readme_stat)
 
         # Update command metadata with directory context
+        cwd = str(directory)
         for cmd in commands:
-            if isinstance(cmd, dict):
-                cmd_metadata = cmd.setdefault("metadata", {})
-                cmd_metadata["cwd"] = str(directory)
-                cmd_metadata["source"] = display_path
-            elif hasattr(cmd, "metadata"):
-                if not hasattr(cmd.metadata, "get") or not callable(cmd.metadata.get):
-                    cmd.metadata = {"original_metadata": cmd.metadata}
-                cmd.metadata["cwd"] = str(directory)
-                if not getattr(cmd, "source", None):
-                    cmd.source = display_path
+            try:
+                metadata = cmd.metadata
+            except AttributeError:
+                continue
+            if not callable(getattr(metadata, "get", None)):
+                metadata = cmd.metadata = {"original_metadata": metadata}
+            metadata["cwd"] = cwd
+            metadata["source"] = display_path
+            if not getattr(cmd, "source", None):
+                cmd.source = display_path
 
         all_commands.extend(commands)
-        logger.info(f"Found {len(commands)} commands in {display_path}")
+        logger.info("Found %s commands in %s", len(commands), display_path)
+
+    def _directory_readme_commands(
+        self,
+        directory: Path,
+        parent_dir: Optional[str] = None,
+        entries: Optional[Set[str]] = None,
+    ) -> List:
+        """Collect the commands of a directory README.md.
+
+        Runs as a worker task of :meth:`scan_project`, so errors are logged
+        instead of aborting the whole scan.
+
+        Args:
+            directory: Directory that may contain a README.md
+            parent_dir: Name of parent directory (for second-level directories)
+            entries: Names of the entries in ``directory``, if already listed
+
+        Returns:
+            List of commands found in the README.md
+        """
+        commands = []
+        try:
+            self._process_directory_readme(directory, commands, parent_dir, entries)
+        except Exception as e:
+            logger.error(
+                f"Error processing README.md in {directory}: {e}", exc_info=True
+            )
+        return commands
 
-    def _process_file_commands(self, file_path: Union[str, Path]) -> List[Dict]:
+    def _process_file_commands(
+        self,
+        file_path: Union[str, Path],
+        file_stat: Optional[os.stat_result] = None,
+    ) -> List[Command]:
         """Process a single file and extract commands.
 
         Args:
             file_path: Path to the file to process (can be str or Path)
+            file_stat: Stat result of a regular file the caller already checked
 
         Returns:
-            List of command dictionaries with metadata
+            List of commands with file and source set
         """
         # Convert to Path object if needed
         path = Path(file_path) if isinstance(file_path, str) else file_path
-        logger.debug(f"Processing file: {path}")
+        logger.debug("Processing file: %s", path)
         commands = []
 
         try:
             # Check if file exists and is a file
-            if not path.exists():
-                logger.warning(f"File not found: {path}")
-                return commands
-
-            if not path.is_file():
-                logger.debug(f"Path is not a file: {path}")
-                return commands
+            if file_stat is None:
+                file_stat = _stat_regular(path)
+                if file_stat is None:
+                    logger.warning(f"File not found or not a file: {path}")
+                    return commands
 
             # Get the appropriate parser for the file
-            parser = self._get_parser_for_file(path)
+            parser = self._find_parser(path, file_stat)
             if not parser:
-                logger.debug(f"No suitable parser found for file: {path}")
+                logger.debug("No suitable parser found for file: %s", path)
                 return commands
 
-            # Set the file_path on the parser if it has that attribute
-            if hasattr(parser, "file_path"):
-                parser.file_path = path
-
-            # Set project root if needed
-            if hasattr(parser, "project_root") and not hasattr(
-                parser, "_project_root_set"
-            ):
-                parser.project_root = self.project_path
-                parser._project_root_set = True
+            # Parser instances are shared between scan threads, so files
+            # handled by the same parser are parsed one at a time
+            parser_lock = self._parser_locks.get(id(parser))
+            if parser_lock is None:
+                parser_lock = self._parser_locks.setdefault(
+                    id(parser), threading.Lock()
+                )
+            with parser_lock:
+                file_commands = self._parse_with(parser, path, file_stat)
+            if file_commands is None:
+                return commands
 
-            # Parse commands from file
-            file_commands = []
-            try:
-                # Try different parsing methods in order of preference
-                if hasattr(parser, "parse_file") and callable(parser.parse_file):
-                    file_commands = parser.parse_file(path)
-                elif hasattr(parser, "parse") and callable(parser.parse):
-                    # First try without arguments (parser will handle file reading)
-                    try:
-                        file_commands = parser.parse()
-                    except (TypeError, AttributeError) as e:
-                        logger.debug(
-                            f"Parser.parse() failed, trying with file path: {e}"
-                        )
-                        # If that fails, try with file path
-                        try:
-                            file_commands = parser.parse(path)
-                        except (TypeError, AttributeError) as e:
-                            logger.debug(
-                                f"Parser.parse(path) failed, trying with file content: {e}"
+            if not isinstance(file_commands, list):
+                logger.warning(
+                    f"Parser returned non-list result: {type(file_commands)}"
+                )
+                file_commands = []
+
+            # Process the parsed commands. Dictionaries become Command objects
+            # right away so scan_project does not need another pass over all
+            # commands; anything that is neither is skipped.
+            file_str = str(path)
+            source = self._relpath_str(file_str) or file_str
+            defaults = {**_COMMAND_DEFAULTS, "file": file_str, "source": source}
+            processed_commands = []
+            for cmd in file_commands:
+                try:
+                    if isinstance(cmd, dict):
+                        processed_commands.append(
+                            Command(
+                                *_command_fields({**defaults, **cmd}),
+                                metadata=cmd.get("metadata", {}),
                             )
-                            # As a last resort, try with file content
-                            try:
-                                content = path.read_text(encoding="utf-8")
-                                file_commands = parser.parse(content)
-                            except Exception as e:
-                                logger.error(
-                                    f"Error parsing {path} with content: {e}",
-                                    exc_info=logger.isEnabledFor(logging.DEBUG),
-                                )
-                                return []
-
-                if not isinstance(file_commands, list):
+                        )
+                    elif hasattr(cmd, "__dict__"):  # Object with attributes
+                        if not getattr(cmd, "file", None):
+                            cmd.file = file_str
+                        if not getattr(cmd, "source", None):
+                            cmd.source = source
+                        processed_commands.append(cmd)
+                except Exception as e:
                     logger.warning(
-                        f"Parser returned non-list result: {type(file_commands)}"
+                        f"Error processing command from {path}: {e}",
+                        exc_info=logger.isEnabledFor(logging.DEBUG),
                     )
-                    file_commands = []
 
-                # Process the parsed commands
-                processed_commands = []
-                for cmd in file_commands:
-                    try:
-                        if cmd is None:
-                            continue
-
-                        # Handle both dict and object-style commands
-                        if isinstance(cmd, dict):
-                            # Ensure required fields exist
-                            cmd.setdefault("file", str(path))
-                            if "source" not in cmd:
-                                try:
-                                    cmd["source"] = str(
-                                        path.relative_to(self.project_path)
-                                    )
-                                except ValueError:
-                                    cmd["source"] = str(path)
-                            processed_commands.append(cmd)
-
-                        elif hasattr(cmd, "__dict__"):  # Object with attributes
-                            if not hasattr(cmd, "file") or not cmd.file:
-                                cmd.file = str(path)
-                            if not hasattr(cmd, "source") or not cmd.source:
-                                try:
-                                    cmd.source = str(
-                                        path.relative_to(self.project_path)
-                                    )
-                                except ValueError:
-                                    cmd.source = str(path)
-                            processed_commands.append(cmd)
+            commands.extend(processed_commands)
+            logger.debug("Found %s commands in %s", len(processed_commands), path)
 
-                    except Exception as e:
-                        logger.warning(
-                            f"Error processing command from {path}: {e}",
-                            exc_info=logger.isEnabledFor(logging.DEBUG),
-                        )
+        except Exception as e:
+            logger.error(
+                f"Unexpected error processing {path}: {e}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+
+        return commands
+
+    def _read_content(
+        self, path: Path, file_stat: Optional[os.stat_result] = None
+    ) -> bytes:
+        """Read a file, reusing the content of recently read unchanged files.
+
+        Only files up to ``CONTENT_CACHE_MAX_FILE_SIZE`` bytes are cached.
+
+        Args:
+            path: Path to the file
+            file_stat: Stat result of the file, if already known
+
+        Returns:
+            Raw file content
+        """
+        if file_stat is None:
+            file_stat = os.stat(path)
+        key = (str(path), file_stat.st_mtime_ns, file_stat.st_size)
+
+        with self._content_cache_lock:
+            content = self._content_cache.get(key)
+            if content is not None:
+                self._content_cache.move_to_end(key)
+                return content
+
+        with open(path, "rb") as f:
+            content = f.read()
+
+        if file_stat.st_size > CONTENT_CACHE_MAX_FILE_SIZE:
+            # Keep the cache from pinning several large files in memory
+            return content
+
+        with self._content_cache_lock:
+            self._content_cache[key] = content
+            if len(self._content_cache) > CONTENT_CACHE_SIZE:
+                self._content_cache.popitem(last=False)
+        return content
+
+    def _parse_with(
+        self, parser: Any, path: Path, file_stat: Optional[os.stat_result] = None
+    ) -> Optional[List]:
+        """Run a parser on a file, setting its file context first.
+
+        The parser is called the way its signature asks for (see
+        :func:`_parser_call_mode`); the other calling conventions are only
+        tried if that call fails with ``TypeError`` or ``AttributeError``.
+
+        Args:
+            parser: Parser returned by :meth:`_find_parser`
+            path: Path to the file to parse
+            file_stat: Stat result of the file, if already known
+
+        Returns:
+            Parsed commands, or None if the file could not be parsed
+        """
+        self._prepare_parser(parser, path)
+
+        mode = _parser_call_mode(parser)
+
+        try:
+            if mode == "parse_file":
+                return parser.parse_file(path)
+            if mode is None:
+                return []
 
-                commands.extend(processed_commands)
-                logger.debug(f"Found {len(processed_commands)} commands in {path}")
+            if mode == "parse_zero":
+                # Parser reads the file itself
+                try:
+                    return parser.parse()
+                except (TypeError, AttributeError) as e:
+                    logger.debug("Parser.parse() failed, trying with file path: %s", e)
+                    mode = "parse_path"
 
+            if mode == "parse_path":
+                try:
+                    return parser.parse(path)
+                except (TypeError, AttributeError) as e:
+                    logger.debug(
+                        "Parser.parse(path) failed, trying with file content: %s", e
+                    )
+
+            # Parser expects the file content
+            try:
+                content = self._read_content(path, file_stat)
+                return parser.parse(content.decode("utf-8"))
             except Exception as e:
                 logger.error(
-                    f"Error parsing {path}: {e}",
+                    f"Error parsing {path} with content: {e}",
                     exc_info=logger.isEnabledFor(logging.DEBUG),
                 )
+                return None
 
         except Exception as e:
             logger.error(
-                f"Unexpected error processing {path}: {e}",
+                f"Error parsing {path}: {e}",
                 exc_info=logger.isEnabledFor(logging.DEBUG),
             )
-
-        return commands
+            return None
 
     def scan_project(self) -> List[Command]:
         """Scan the project for commands in configuration files.
@@ -408,48 +950,43 @@ class ProjectCommandDetector:
         Returns:
             List of Command objects
         """
-        logger.info(f"Scanning project: {self.project_path}")
+        logger.info("Scanning project: %s", self.project_path)
         all_commands = []
 
         # 1. Scan root directory for configuration files
         config_files = self.config_handler.find_config_files(self.parsers)
-        logger.info(f"Found {len(config_files)} configuration files in root directory")
-
-        # Process root directory files
-        for file_path in config_files:
-            all_commands.extend(self._process_file_commands(file_path))
+        logger.info("Found %s configuration files in root directory", len(config_files))
 
-        # 2. Scan first and second level subdirectories for README.md files
+        # 2. Collect first and second level subdirectories that may hold a
+        # README.md file
+        readme_dirs = []
+        add_readme_dir = readme_dirs.append
+        visible_subdirs = self._visible_subdirs
         try:
-            logger.debug(f"Starting directory scan in: {self.project_path}")
+            logger.debug("Starting directory scan in: %s", self.project_path)
             # First level directories
-            for level1_item in sorted(self.project_path.iterdir()):
-                logger.debug(f"Checking first level item: {level1_item}")
-                if not level1_item.is_dir() or level1_item.name.startswith("."):
-                    logger.debug(f"Skipping (not a directory or hidden): {level1_item}")
-                    continue
-
-                logger.info(f"Processing first level directory: {level1_item.name}")
-                # Process level 1 README
-                self._process_directory_readme(level1_item, all_commands)
+            for level1_entry in visible_subdirs(self.project_path):
+                level1_item = Path(level1_entry.path)
+                logger.info("Processing first level directory: %s", level1_item.name)
+                # Listing the second level also tells whether README.md exists
+                level1_names = set()
+                level1_index = len(readme_dirs)
+                add_readme_dir((level1_item, None, None))
 
                 # Scan second level
                 try:
-                    for level2_item in sorted(level1_item.iterdir()):
-                        logger.debug(f"  Checking second level item: {level2_item}")
-                        if not level2_item.is_dir() or level2_item.name.startswith("."):
-                            logger.debug(
-                                f"  Skipping (not a directory or hidden): {level2_item}"
-                            )
-                            continue
-
+                    for level2_entry in visible_subdirs(
+                        level1_entry.path, level1_entry.name, level1_names
+                    ):
                         logger.info(
-                            f"  Processing second level directory: {level1_item.name}/{level2_item.name}"
+                            "  Processing second level directory: %s/%s",
+                            level1_item.name,
+                            level2_entry.name,
                         )
-                        # Process level 2 README
-                        self._process_directory_readme(
-                            level2_item, all_commands, level1_item.name
+                        add_readme_dir(
+                            (Path(level2_entry.path), level1_item.name, None)
                         )
+                    readme_dirs[level1_index] = (level1_item, None, level1_names)
                 except Exception as e:
                     logger.error(
                         f"Error scanning subdirectory {level1_item}: {e}", exc_info=True
@@ -457,30 +994,30 @@ class ProjectCommandDetector:
         except Exception as e:
             logger.error(f"Error scanning directories: {e}", exc_info=True)
 
+        # 3. Parse all files in parallel; results keep the discovery order
+        tasks = [partial(self._process_file_commands, path) for path in config_files]
+        tasks += [
+            partial(self._directory_readme_commands, directory, parent_dir, names)
+            for directory, parent_dir, names in readme_dirs
+        ]
+        add_commands = all_commands.extend
+        if len(tasks) > 1:
+            max_workers = min(len(tasks), _MAX_SCAN_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for commands in executor.map(_call, tasks):
+                    add_commands(commands)
+        else:
+            for task in tasks:
+                add_commands(task())
+
         logger.debug(
-            f"Finished directory scan. Found {len(all_commands)} commands total."
+            "Finished directory scan. Found %s commands total.", len(all_commands)
         )
 
-        logger.info(f"Found {len(all_commands)} commands in total")
-
-        # Konwertuj wszystkie słowniki na obiekty Command
-        result_commands = []
-        for cmd in all_commands:
-            if isinstance(cmd, dict):
-                command = Command(
-                    command=cmd.get("command", ""),
-                    type=cmd.get("type", ""),
-                    description=cmd.get("description", ""),
-                    source=cmd.get("source", ""),
-                    file=cmd.get("file", ""),
-                    metadata=cmd.get("metadata", {}),
-                )
-                result_commands.append(command)
-            else:
-                # Już jest obiektem Command lub podobnym
-                result_commands.append(cmd)
+        logger.info("Found %s commands in total", len(all_commands))
 
-        return result_commands
+        # Słowniki zostały już zamienione na obiekty Command
+        return all_commands
 
     def _get_parser_for_file(self, file_path: Union[str, Path]) -> Optional[BaseParser]:
         """Get a parser for a specific file (legacy method).
@@ -494,17 +1031,84 @@ class ProjectCommandDetector:
         # Ensure we have a Path object
         path = Path(file_path) if isinstance(file_path, str) else file_path
 
-        if not path.exists():
-            logger.debug(f"File does not exist: {path}")
+        if _safe_stat(path) is None:
+            logger.debug("File does not exist: %s", path)
             return None
 
-        logger.debug(f"Looking for parser for file: {path}")
+        parser = self._find_parser(path)
+        if parser is not None:
+            self._prepare_parser(parser, path)
+        return parser
+
+    def _prepare_parser(self, parser: Any, path: Path) -> None:
+        """Point a parser at the file it is about to handle.
+
+        Args:
+            parser: Parser instance
+            path: Path to the file
+        """
+        # Set the file_path on the parser if it has that attribute
+        if hasattr(parser, "file_path"):
+            parser.file_path = path
+
+        # The project root only needs to be set once per parser
+        if not getattr(parser, "_project_root_set", False) and hasattr(
+            parser, "project_root"
+        ):
+            parser.project_root = self.project_path
+            parser._project_root_set = True
+
+    def _find_parser(
+        self, path: Path, file_stat: Optional[os.stat_result] = None
+    ) -> Optional[BaseParser]:
+        """Find a parser for a file that is known to exist.
+
+        When the file's stat result is given, the answer is remembered until
+        the file changes or ``self.parsers`` is replaced, so repeated scans
+        skip the ``can_parse`` checks.
+
+        Args:
+            path: Path to the file
+            file_stat: Stat result of the file, if already known
+
+        Returns:
+            Parser instance or None if no parser found
+        """
+        candidates = self._candidate_parsers(path.name)
+        if file_stat is None:
+            return self._probe_parsers(path, candidates)
+
+        key = (str(path), file_stat.st_mtime_ns, file_stat.st_size)
+        with self._parser_cache_lock:
+            if key in self._parser_cache:
+                self._parser_cache.move_to_end(key)
+                return self._parser_cache[key]
+
+        parser = self._probe_parsers(path, candidates)
+
+        with self._parser_cache_lock:
+            self._parser_cache[key] = parser
+            if len(self._parser_cache) > PARSER_CACHE_SIZE:
+                self._parser_cache.popitem(last=False)
+        return parser
+
+    def _probe_parsers(self, path: Path, candidates: tuple) -> Optional[BaseParser]:
+        """Return the first candidate parser whose ``can_parse`` accepts a file.
 
-        for parser in self.parsers:
+        Args:
+            path: Path to the file
+            candidates: Parsers to try, in order of preference
+
+        Returns:
+            Parser instance or None if no parser found
+        """
+        logger.debug("Looking for parser for file: %s", path)
+
+        for parser in candidates:
             try:
                 if not hasattr(parser, "can_parse"):
                     logger.debug(
-                        f"Parser {parser.__class__.__name__} has no can_parse method"
+                        "Parser %s has no can_parse method", parser.__class__.__name__
                     )
                     continue
 
@@ -521,16 +1125,10 @@ class ProjectCommandDetector:
 
                 if can_parse:
                     logger.debug(
-                        f"Found matching parser: {parser.__class__.__name__} for {path}"
+                        "Found matching parser: %s for %s",
+                        parser.__class__.__name__,
+                        path,
                     )
-                    # Set the file_path on the parser if it has that attribute
-                    if hasattr(parser, "file_path"):
-                        parser.file_path = path
-                    if hasattr(parser, "project_root") and not hasattr(
-                        parser, "_project_root_set"
-                    ):
-                        parser.project_root = self.project_path
-                        parser._project_root_set = True
                     return parser
 
             except Exception as e:
@@ -540,7 +1138,7 @@ class ProjectCommandDetector:
                 )
                 continue
 
-        logger.debug(f"No parser found for file: {path}")
+        logger.debug("No parser found for file: %s", path)
         return None
 
     def test_commands(self, commands: List) -> None:
@@ -581,20 +1179,20 @@ class ProjectCommandDetector:
         """
         return self.command_handler.execute_command(command, **kwargs)
 
-    def run_in_venv(self, command, **kwargs) -> Dict[str, Any]:
-        """Run a command in the virtual environment.
+    @cached_property
+    def _venv_env_base(self) -> Dict[str, str]:
+        """Environment for commands run in the virtual environment.
 
-        Args:
-            command: Command to execute (string or list of args)
-            **kwargs: Additional arguments to pass to command_handler
+        Built on first use and reused until ``venv_path`` or ``venv_info`` is
+        set again; :meth:`run_in_venv` passes it on read-only. ``os.environ``
+        is captured when it is built, so variables changed later are not seen
+        by commands run in the virtual environment until then.
 
         Returns:
-            Dictionary with command execution results
+            Dictionary with environment variables
         """
-        logger.debug(f"Running command in virtualenv: {command}")
-
         # Get environment variables for virtualenv
-        venv_env = self._get_environment()
+        venv_env = dict(self._get_environment())
         logger.debug(f"Initial venv_env: {venv_env}")
 
         # Ensure we have the virtual environment path in the environment
@@ -624,6 +1222,23 @@ class ProjectCommandDetector:
             logger.warning("No virtual environment path found in venv_info")
 
         logger.debug(f"Final environment for command execution: {venv_env}")
+        return venv_env
+
+    def run_in_venv(self, command, **kwargs) -> Dict[str, Any]:
+        """Run a command in the virtual environment.
+
+        Args:
+            command: Command to execute (string or list of args)
+            **kwargs: Additional arguments to pass to command_handler
+
+        Returns:
+            Dictionary with command execution results
+        """
+        logger.debug(f"Running command in virtualenv: {command}")
+
+        # Hand out a read-only view of the prepared environment; the command
+        # handler copies it when merging overrides
+        venv_env = MappingProxyType(self._venv_env_base)
 
         try:
             # Pass the environment to command_handler.run_in_venv
@@ -669,13 +1284,47 @@ class ProjectCommandDetector:
         Returns:
             List of configuration file paths
         """
-        # Initialize parsers if not already done
-        if not hasattr(self, "parsers") or not self.parsers:
-            self.parsers = self._initialize_parsers()
-
         # Use the config handler to find configuration files
         return self.config_handler.find_config_files(self.parsers)
 
+    @cached_property
+    def _report_formatter(self) -> MarkdownFormatter:
+        """Formatter for TODO.md and DONE.md, reused across report runs.
+
+        Both reports go through the same formatter; titles are not part of
+        the formatter state that ``format_report`` reads.
+
+        Returns:
+            The reporter's "todo" formatter, or a new Markdown formatter
+        """
+        formatter = self.reporter._formatter_instances.get("todo")
+        return formatter or MarkdownFormatter(title="TODO Commands")
+
+    def _report_commands(
+        self,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Failed and successful commands as report dictionaries.
+
+        :meth:`generate_reports` converts the commands once and shares the
+        result between the reports and the fix script.
+
+        Returns:
+            Tuple of failed and successful command dictionaries
+        """
+        # Konwertuj obiekty Command na słowniki
+        return (
+            [
+                _command_to_dict(cmd, _FAILED_REPORT_FIELDS)
+                for cmd in self.failed_commands
+                if isinstance(cmd, (dict, Command)) or hasattr(cmd, "to_dict")
+            ],
+            [
+                _command_to_dict(cmd, _SUCCESSFUL_REPORT_FIELDS)
+                for cmd in self.successful_commands
+                if isinstance(cmd, (dict, Command)) or hasattr(cmd, "to_dict")
+            ],
+        )
+
     def generate_reports(self) -> Dict[str, Path]:
         """Generate reports for successful and failed commands.
 
@@ -684,111 +1333,75 @@ class ProjectCommandDetector:
         """
         logger.info("Generating reports")
 
-        # Konwertuj obiekty Command na słowniki
-        failed_commands_dicts = []
-        for cmd in self.failed_commands:
-            if hasattr(cmd, "to_dict"):
-                # Jeśli to obiekt Command, użyj metody to_dict
-                cmd_dict = cmd.to_dict()
-                # Dodaj dodatkowe pola wymagane przez formater bezpośrednio z atrybutów
-                if hasattr(cmd, "return_code"):
-                    cmd_dict["return_code"] = getattr(cmd, "return_code")
-                elif hasattr(cmd, "metadata") and isinstance(cmd.metadata, dict):
-                    cmd_dict["return_code"] = cmd.metadata.get("return_code", -1)
-                else:
-                    cmd_dict["return_code"] = -1
-
-                if hasattr(cmd, "error"):
-                    cmd_dict["error"] = getattr(cmd, "error")
-                elif hasattr(cmd, "metadata") and isinstance(cmd.metadata, dict):
-                    cmd_dict["error"] = cmd.metadata.get("error", "")
-                else:
-                    cmd_dict["error"] = ""
-
-                if hasattr(cmd, "execution_time"):
-                    cmd_dict["execution_time"] = getattr(cmd, "execution_time")
-                elif hasattr(cmd, "metadata") and isinstance(cmd.metadata, dict):
-                    cmd_dict["execution_time"] = cmd.metadata.get("execution_time", 0)
-                else:
-                    cmd_dict["execution_time"] = 0
-
-                if hasattr(cmd, "success"):
-                    cmd_dict["success"] = getattr(cmd, "success")
-
-                if hasattr(cmd, "stdout"):
-                    cmd_dict["stdout"] = getattr(cmd, "stdout")
-
-                if hasattr(cmd, "stderr"):
-                    cmd_dict["stderr"] = getattr(cmd, "stderr")
-
-                failed_commands_dicts.append(cmd_dict)
-            elif isinstance(cmd, dict):
-                # Jeśli to już słownik, użyj go bezpośrednio
-                failed_commands_dicts.append(cmd)
-
-        successful_commands_dicts = []
-        for cmd in self.successful_commands:
-            if hasattr(cmd, "to_dict"):
-                cmd_dict = cmd.to_dict()
-                # Dodaj dodatkowe pola wymagane przez formater bezpośrednio z atrybutów
-                if hasattr(cmd, "execution_time"):
-                    cmd_dict["execution_time"] = getattr(cmd, "execution_time")
-                elif hasattr(cmd, "metadata") and isinstance(cmd.metadata, dict):
-                    cmd_dict["execution_time"] = cmd.metadata.get("execution_time", 0)
-                else:
-                    cmd_dict["execution_time"] = 0
-
-                if hasattr(cmd, "success"):
-                    cmd_dict["success"] = getattr(cmd, "success")
-
-                if hasattr(cmd, "stdout"):
-                    cmd_dict["stdout"] = getattr(cmd, "stdout")
-
-                successful_commands_dicts.append(cmd_dict)
-            elif isinstance(cmd, dict):
-                # Jeśli to już słownik, użyj go bezpośrednio
-                successful_commands_dicts.append(cmd)
-
-        # Przygotuj dane dla raportów
+        if not self.failed_commands and not self.successful_commands:
+            # Nic nie uruchomiono: oba raporty dostają te same puste dane,
+            # a skrypt składa się tylko z nagłówka
+            return self._write_reports(
+                _EMPTY_REPORT_DATA, _EMPTY_REPORT_DATA, _SCRIPT_HEADER
+            )
+
+        failed_commands_dicts, successful_commands_dicts = self._report_commands()
+
+        # Przygotuj dane dla raportów. MarkdownFormatter liczy "commands" do
+        # podsumowania, a sekcje renderuje z list "failed_commands" /
+        # "successful_commands", więc oba klucze wskazują ten sam obiekt
+        # listy (alias, bez kopii).
         failed_data = {
             "commands": failed_commands_dicts,
             "failed_commands": failed_commands_dicts,
-            "successful_commands": [],
-            "ignored_commands": [],
+            "successful_commands": _NO_COMMANDS,
+            "ignored_commands": _NO_COMMANDS,
         }
 
         successful_data = {
             "commands": successful_commands_dicts,
-            "failed_commands": [],
+            "failed_commands": _NO_COMMANDS,
             "successful_commands": successful_commands_dicts,
-            "ignored_commands": [],
+            "ignored_commands": _NO_COMMANDS,
         }
 
-        # Użyj formatera bezpośrednio
-        todo_formatter = self.reporter._formatter_instances.get("todo")
-        if not todo_formatter:
-            # Jeśli nie ma instancji formatera, utwórz nową
-            todo_formatter = MarkdownFormatter(title="TODO Commands")
+        script_content = (
+            self._shell_script_content(failed_commands_dicts)
+            if self.script_file
+            else None
+        )
+        return self._write_reports(failed_data, successful_data, script_content)
 
-        # Sformatuj dane i zapisz do pliku
-        todo_content = todo_formatter.format_report(failed_data)
-        self.todo_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.todo_file, "w", encoding="utf-8") as f:
-            f.write(todo_content)
+    def _write_reports(
+        self,
+        failed_data: Dict[str, Any],
+        successful_data: Dict[str, Any],
+        script_content: Optional[str],
+    ) -> Dict[str, Path]:
+        """Render the TODO/DONE reports and write them with the fix script.
 
-        # To samo dla raportu DONE
-        done_formatter = self.reporter._formatter_instances.get("done")
-        if not done_formatter:
-            done_formatter = MarkdownFormatter(title="DONE Commands")
+        Args:
+            failed_data: Report data for TODO.md
+            successful_data: Report data for DONE.md
+            script_content: Content of the fix script
 
-        done_content = done_formatter.format_report(successful_data)
-        self.done_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.done_file, "w", encoding="utf-8") as f:
-            f.write(done_content)
+        Returns:
+            Dictionary with report file paths
+        """
+        # Sformatuj oba raporty jednym wywołaniem, a potem zapisz je razem
+        todo_content, done_content = self._report_formatter.format_reports(
+            (failed_data, successful_data)
+        )
+        outputs = [(self.todo_file, todo_content), (self.done_file, done_content)]
 
         # Generate shell script if needed
         if self.script_file:
-            self._generate_shell_script()
+            logger.info(f"Generating shell script: {self.script_file}")
+            outputs.append((self.script_file, script_content))
+
+        for parent in {path.parent for path, _ in outputs}:
+            parent.mkdir(parents=True, exist_ok=True)
+        # The files are independent, so their writes can overlap
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            list(executor.map(_write_report_file, outputs))
+
+        if self.script_file:
+            self._make_script_executable()
 
         return {
             "todo": self.todo_file,
@@ -796,37 +1409,35 @@ class ProjectCommandDetector:
             "script": self.script_file if self.script_file else None,
         }
 
-    def _generate_shell_script(self) -> None:
-        """Generate a shell script to fix failed commands."""
-        logger.info(f"Generating shell script: {self.script_file}")
-
-        script_lines = [
-            "#!/bin/bash",
-            "# Auto-generated script to fix failed commands",
-            "# Generated by domd",
-            "",
-            "set -e",
-            "",
-        ]
+    def _shell_script_content(self, failed: List[Dict[str, Any]]) -> str:
+        """Build the shell script that re-runs the failed commands.
 
-        for cmd in self.failed_commands:
-            if isinstance(cmd, dict):
-                command = cmd.get("command", "")
-            else:
-                command = getattr(cmd, "command", "")
+        Args:
+            failed: Failed commands as report dictionaries
 
-            if command:
-                script_lines.append(f"echo 'Running: {command}'")
-                script_lines.append(command)
-                script_lines.append("")
+        Returns:
+            Script content
+        """
+        return "".join(self._iter_shell_script(failed))
 
-        with open(self.script_file, "w") as f:
-            f.write("\n".join(script_lines))
+    def _iter_shell_script(self, failed: List[Dict[str, Any]]) -> Iterator[str]:
+        """Generate the blocks of the shell script that re-runs failed commands.
 
-        # Make script executable
-        try:
-            import os
+        Args:
+            failed: Failed commands as report dictionaries
+
+        Yields:
+            The script header, then one pre-formatted block per command
+        """
+        yield _SCRIPT_HEADER
+        for attrs in failed:
+            command = attrs.get("command")
+            if command:
+                yield f"\necho 'Running: {command}'\n{command}\n"
 
+    def _make_script_executable(self) -> None:
+        """Make the generated shell script executable."""
+        try:
             os.chmod(self.script_file, 0o755)
         except Exception as e:
             logger.warning(f"Could not make script executable: {e}")
@@ -834,61 +1445,55 @@ class ProjectCommandDetector:
     def create_llm_optimized_todo_md(self) -> None:
         """Generate a TODO.md file with failed commands and fix suggestions."""
         try:
-            # Create the TODO.md file with a header
-            with open(self.todo_file, "w", encoding="utf-8") as f:
-                f.write("# 🤖 TODO - LLM Task List for Command Fixes\n\n")
-                f.write("## ❌ Failed Commands\n\n")
-
-                # Add failed commands to the TODO.md file
-                if self.failed_commands:
-                    for cmd in self.failed_commands:
-                        # Handle both dictionary and object formats
-                        cmd_dict = cmd if isinstance(cmd, dict) else cmd.__dict__
-
-                        # Skip if command or error is missing
-                        if not cmd_dict.get("command") or not cmd_dict.get("error"):
-                            continue
-
-                        command = cmd_dict["command"]
-                        error = cmd_dict["error"]
-                        source = cmd_dict.get("source", "Unknown")
-
-                        f.write(f"### 🔧 Fix: {command}\n")  # noqa: E231
-                        f.write(
-                            f"- [ ] **Command**: `{command}`  \n"
-                        )  # noqa: E201,E231
-                        f.write(f"- **Error**: {error}  \n")  # noqa: E231
-                        f.write(f"- **Source**: `{source}`\n")  # noqa: E231
-                        f.write("- **Fix Suggestion**: \n\n")  # noqa: E231
-                        f.write(
-                            "  ```bash\n  # Suggested fix\n  # Replace with the correct command\n  ```\n\n"
-                        )  # noqa: E201, E202, E221, E231
-                else:
-                    f.write("No failed commands found. 🎉\n\n")
-
-                # Add a section for successful commands
-                f.write("---\n\n")
-                f.write("## ✅ Successful Commands\n\n")
-                if self.successful_commands:
-                    for cmd in self.successful_commands:
-                        # Handle both dictionary and object formats
-                        cmd_dict = cmd if isinstance(cmd, dict) else cmd.__dict__
-
-                        # Skip if command is missing
-                        if not cmd_dict.get("command"):
-                            continue
-
-                        command = cmd_dict["command"]
-                        source = cmd_dict.get("source", "Unknown")
-
-                        f.write(f"- [x] `{command}`  \n")  # noqa: E231
-                        f.write(f"  - Source: `{source}`\n")  # noqa: E221,E231
-                else:
-                    f.write("No commands were executed successfully.\n")
-
-                # Add footer
-                f.write("\n---\n")
-                f.write("Generated by [DOMD](https://github.com/wronai/domd)")
+            # Collect the whole document and write it in one call
+            lines = [
+                "# 🤖 TODO - LLM Task List for Command Fixes\n\n",
+                "## ❌ Failed Commands\n\n",
+            ]
+            append = lines.append
+
+            failed, successful = self._report_commands()
+
+            # Add failed commands to the TODO.md file, skipping entries
+            # without a command or an error before any formatting
+            if self.failed_commands:
+                renderable = [
+                    attrs
+                    for attrs in failed
+                    if attrs.get("command") and attrs.get("error")
+                ]
+                lines += [
+                    _FAILED_TODO_BLOCK.format(
+                        command=attrs["command"],
+                        error=attrs["error"],
+                        source=attrs.get("source", "Unknown"),
+                    )
+                    for attrs in renderable
+                ]
+            else:
+                append("No failed commands found. 🎉\n\n")
+
+            # Add a section for successful commands
+            append("---\n\n")
+            append("## ✅ Successful Commands\n\n")
+            if self.successful_commands:
+                renderable = [attrs for attrs in successful if attrs.get("command")]
+                lines += [
+                    _SUCCESSFUL_TODO_BLOCK.format(
+                        command=attrs["command"],
+                        source=attrs.get("source", "Unknown"),
+                    )
+                    for attrs in renderable
+                ]
+            else:
+                append("No commands were executed successfully.\n")
+
+            # Add footer
+            append("\n---\n")
+            append("Generated by [DOMD](https://github.com/wronai/domd)")
+
+            # Create the TODO.md file
+            Path(self.todo_file).write_bytes("".join(lines).encode("utf-8"))
 
             logger.info(f"Created TODO.md file at {self.todo_file}")
         except Exception as e:
@@ -922,19 +1527,17 @@ class ProjectCommandDetector:
 
     def _load_ignore_patterns(self) -> None:
         """Load ignore patterns from .doignore file."""
-        if not self.ignore_file.exists():
-            logger.debug(f"Ignore file not found: {self.ignore_file}")
-            return
-
         try:
-            with open(self.ignore_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            patterns = []
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    patterns.append(line)
+            if _safe_stat(self.ignore_file) is None:
+                logger.debug(f"Ignore file not found: {self.ignore_file}")
+                return
+
+            text = self.ignore_file.read_text(encoding="utf-8")
+            patterns = [
+                line
+                for line in map(str.strip, text.splitlines())
+                if line and not line.startswith("#")
+            ]
 
             self.ignore_patterns = patterns
             self.command_handler.ignore_patterns = patterns
@@ -953,7 +1556,7 @@ class ProjectCommandDetector:
         Returns:
             True if the command should be ignored, False otherwise
         """
-        return self.command_handler.should_ignore_command({"command": command})
+        return self.command_handler.is_ignored_command(command)
 
     def get_ignore_reason(self, command):
         """Get the reason why a command is ignored.
@@ -989,7 +1592,7 @@ class ProjectCommandDetector:
             self.ignore_file.parent.mkdir(parents=True, exist_ok=True)
 
             # Don't overwrite existing file
-            if self.ignore_file.exists():
+            if _safe_stat(self.ignore_file) is not None:
                 logger.info(f"Ignore file already exists: {self.ignore_file}")
                 return True
 
@@ -1021,8 +1624,9 @@ class ProjectCommandDetector:
             ]
 
             # Write the template
-            with open(self.ignore_file, "w", encoding="utf-8") as f:
-                f.write("\n".join(default_patterns))
+            Path(self.ignore_file).write_text(
+                "\n".join(default_patterns), encoding="utf-8"
+            )
 
             logger.info(f"Created ignore file template: {self.ignore_file}")
             return True
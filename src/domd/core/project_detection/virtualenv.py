@@ -2,12 +2,16 @@
 
 import logging
 import os
+import stat
 import sys
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Virtualenv directory names looked up inside a project, in order of preference
+_VENV_DIR_NAMES = (".venv", "venv", "env")
+
 
 def get_virtualenv_info(path: Optional[str] = None) -> Dict[str, Any]:
     """Get information about a virtual environment.
@@ -23,25 +27,35 @@ def get_virtualenv_info(path: Optional[str] = None) -> Dict[str, Any]:
             path = str(Path(path).resolve())
             logger.debug(f"Checking for virtualenv at: {path}")
 
+            # One directory listing tells which of the usual virtualenv
+            # directories exist in the project
+            try:
+                with os.scandir(path) as it:
+                    subdirs = {entry.name for entry in it if entry.is_dir()}
+            except OSError:
+                subdirs = set()
+
             # Check common virtualenv locations
-            venv_dirs = [
-                path,  # Direct path
-                os.path.join(path, ".venv"),  # .venv in project
-                os.path.join(path, "venv"),  # venv in project
-                os.path.join(path, "env"),  # env in project
-            ]
+            venv_dirs = [path]  # Direct path
+            venv_dirs.extend(
+                os.path.join(path, name)
+                for name in _VENV_DIR_NAMES  # .venv, venv, env in project
+                if name in subdirs
+            )
 
             for venv_dir in venv_dirs:
-                if not os.path.isdir(venv_dir):
-                    continue
-
                 # Check for Python executable in bin/Scripts directory
                 bin_dir = "Scripts" if sys.platform == "win32" else "bin"
                 python_path = os.path.join(venv_dir, bin_dir, "python")
                 if sys.platform == "win32":
                     python_path += ".exe"
 
-                if os.path.isfile(python_path):
+                try:
+                    is_python = stat.S_ISREG(os.stat(python_path).st_mode)
+                except OSError:
+                    is_python = False
+
+                if is_python:
                     logger.debug(f"Found virtualenv at: {venv_dir}")
                     activate_script = (
                         "activate.bat" if sys.platform == "win32" else "activate"
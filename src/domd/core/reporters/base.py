@@ -1,13 +1,77 @@
 """Base reporter interface for domd."""
 
+import hashlib
+import json
+import os
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Iterator, Optional, TextIO, Tuple, Union
+
+from domd.utils.file_utils import open_for_replace
+
+
+def _canonical_value(value: Any) -> Any:
+    """Convert a value json cannot encode for a report fingerprint.
+
+    Args:
+        value: Value found in the report data
+
+    Returns:
+        JSON-encodable representation of the value
+
+    Raises:
+        TypeError: If the value is a one-shot iterator, which would be
+            consumed by fingerprinting it
+    """
+    if isinstance(value, Iterator):
+        raise TypeError("Iterators cannot be fingerprinted")
+    to_dict = getattr(value, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return str(value)
+
+
+def _report_fingerprint(reporter: "BaseReporter", data: Dict) -> Optional[str]:
+    """Fingerprint a reporter's configuration and the data of a report.
+
+    The data is encoded and hashed piece by piece, so no serialized copy of
+    the whole report is built.
+
+    Args:
+        reporter: Reporter generating the report
+        data: Data to include in the report
+
+    Returns:
+        Hex digest of the reporter class, its public data attributes and the
+        data, or None if they cannot be fingerprinted without consuming them
+    """
+    config = {
+        name: value
+        for name, value in vars(reporter).items()
+        if name[:1] != "_" and not callable(value)
+    }
+    encoder = json.JSONEncoder(sort_keys=True, default=_canonical_value)
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(type(reporter).__qualname__.encode("utf-8"))
+    try:
+        for chunk in encoder.iterencode([config, data]):
+            digest.update(chunk.encode("utf-8"))
+    except (TypeError, ValueError):
+        return None
+    return digest.hexdigest()
 
 
 class BaseReporter(ABC):
     """Base class for all reporters."""
 
+    # Guards the _written_reports of every reporter; kept on the class so
+    # reporters can still be pickled
+    _written_reports_lock = threading.Lock()
+
     def __init__(self, output_file: Optional[Union[str, Path]] = None):
         """Initialize the reporter.
 
@@ -16,26 +80,44 @@ class BaseReporter(ABC):
         """
         self.output_file = Path(output_file) if output_file else None
 
+        # Report file -> (fingerprint, mtime_ns, size) of the last report this
+        # reporter wrote to it, see write_report
+        self._written_reports: Dict[str, Tuple[str, int, int]] = {}
+
     @abstractmethod
-    def generate_report(self, data: Dict) -> str:
+    def generate_report(self, data: Dict, stream: Optional[TextIO] = None) -> str:
         """Generate the report content.
 
         Args:
             data: Data to include in the report
+            stream: Writable text stream to write the content to instead of
+                returning it
 
         Returns:
-            The generated report as a string
+            The generated report as a string, or an empty string if it was
+            written to ``stream``
         """
         pass
 
     def write_report(
-        self, data: Dict, output_file: Optional[Union[str, Path]] = None
+        self,
+        data: Dict,
+        output_file: Optional[Union[str, Path]] = None,
+        force: bool = False,
     ) -> Path:
         """Generate and write the report to a file.
 
+        The report is not generated again if this reporter, configured the
+        same way, already wrote the same data to the file and the file is
+        unchanged since. Anything the report adds itself, such as the time
+        it was generated, then keeps its old value; pass ``force`` to
+        refresh it. The file is replaced atomically, so an interrupted write
+        leaves the previous report in place.
+
         Args:
             data: Data to include in the report
             output_file: Optional output file path (overrides instance path)
+            force: Write the report even if the data is unchanged
 
         Returns:
             Path to the generated report file
@@ -44,6 +126,24 @@ class BaseReporter(ABC):
         if not output_file:
             raise ValueError("No output file specified")
 
-        content = self.generate_report(data)
-        output_file.write_text(content, encoding="utf-8")
+        key = os.path.abspath(output_file)
+        fingerprint = _report_fingerprint(self, data)
+        if fingerprint is not None and not force:
+            with self._written_reports_lock:
+                written = self._written_reports.get(key)
+            if written is not None and written[0] == fingerprint:
+                try:
+                    st = os.stat(key)
+                except OSError:
+                    st = None
+                if st is not None and (st.st_mtime_ns, st.st_size) == written[1:]:
+                    return output_file
+
+        with open_for_replace(output_file) as f:
+            self.generate_report(data, f)
+
+        if fingerprint is not None:
+            st = os.stat(key)
+            with self._written_reports_lock:
+                self._written_reports[key] = (fingerprint, st.st_mtime_ns, st.st_size)
         return output_file
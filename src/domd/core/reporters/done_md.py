@@ -1,11 +1,54 @@
 """Markdown reporter for DONE.md generation."""
 
-import datetime
+import io
+import os
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, TextIO, Union
+
+from domd.utils.time_utils import now_timestamp
 
 from .base import BaseReporter
 
+# Static text between the summary count and the command list
+_SUMMARY_TAIL = """\
+
+These commands have been tested and are functioning properly.
+You can safely use them in your development workflow.
+
+---
+
+## 🟢 Working Commands
+
+"""
+
+# One working command
+_COMMAND_TEMPLATE = """\
+#### ✅ {description}
+
+**Command:** `{command}`
+**Execution Time:** {execution_time:.2f}s
+**Type:** {type}
+
+**Status:** 🟢 **WORKING**
+
+---
+
+"""
+
+# Static text closing the report, before the last test run time
+_FOOTER = """\
+
+## 🔄 Updating This File
+
+This file is automatically updated when commands are tested.
+To refresh the status:
+
+1. Run: `domd` to test all commands
+2. Working commands will appear here
+3. Failed commands will be moved to [TODO.md](TODO.md) for fixing
+
+"""
+
 
 class DoneMDReporter(BaseReporter):
     """Generates a DONE.md file with successfully executed commands."""
@@ -33,20 +76,22 @@ class DoneMDReporter(BaseReporter):
         if not path:
             return "unknown"
 
-        try:
-            path_obj = Path(path)
-            base_path = Path(base_path) if base_path else Path.cwd()
+        path_str = os.path.normpath(path)
 
-            # If it's already a relative path, return as is
-            if not path_obj.is_absolute():
-                return str(path_obj)
+        # If it's already a relative path, return as is
+        if not os.path.isabs(path_str):
+            return path_str
 
-            # Try to make it relative to the project
-            rel_path = path_obj.relative_to(base_path)
-            return str(rel_path)
-        except (ValueError, TypeError):
-            # If we can't make it relative, return just the filename
-            return str(Path(path).name) if path else "unknown"
+        # Try to make it relative to the project
+        base_str = os.path.normpath(base_path) if base_path else os.getcwd()
+        if path_str == base_str:
+            return "."
+        prefix = base_str if base_str.endswith(os.sep) else base_str + os.sep
+        if path_str.startswith(prefix):
+            return path_str[len(prefix) :]
+
+        # If we can't make it relative, return just the filename
+        return os.path.basename(path_str)
 
     def _format_source_link(
         self, source: str, base_path: Optional[Union[str, Path]] = None
@@ -66,43 +111,46 @@ class DoneMDReporter(BaseReporter):
         rel_path = self._get_relative_path(source, base_path)
 
         # Only create links for markdown files
-        if str(rel_path).lower().endswith(".md"):
+        if rel_path.lower().endswith(".md"):
             return f"[{rel_path}]({rel_path})"
         return rel_path
 
-    def generate_report(self, data: Dict) -> str:
+    def generate_report(self, data: Dict, stream: Optional[TextIO] = None) -> str:
         """Generate the DONE.md content.
 
         Args:
             data: Dictionary containing 'successful_commands' and other metadata
+            stream: Writable text stream to write the content to as it is
+                generated, instead of building it in memory
 
         Returns:
-            Formatted markdown content
+            Formatted markdown content, or an empty string if it was written
+            to ``stream``
         """
+        if stream is None:
+            buffer = io.StringIO()
+            self.generate_report(data, buffer)
+            return buffer.getvalue()
+
         successful_commands = data.get("successful_commands", [])
-        project_path = data.get("project_path")
-
-        content = [
-            "# ✅ DONE - Successfully Working Commands",
-            "",
-            "**🎉 Generated by TodoMD** - List of all working project commands",
-            f"**Last Updated:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"**Total Working Commands:** {len(successful_commands)}",
-            "",
-            "---",
-            "",
-            "## 📊 Summary",
-            "",
-            f"✅ **{len(successful_commands)} commands are working correctly**",
-            "",
-            "These commands have been tested and are functioning properly.",
-            "You can safely use them in your development workflow.",
-            "",
-            "---",
-            "",
-            "## 🟢 Working Commands",
-            "",
-        ]
+        # Base for relative source paths, looked up once per report
+        project_path = data.get("project_path") or os.getcwd()
+        write = stream.write
+
+        write(
+            "# ✅ DONE - Successfully Working Commands\n"
+            "\n"
+            "**🎉 Generated by TodoMD** - List of all working project commands\n"
+            f"**Last Updated:** {now_timestamp()}\n"
+            f"**Total Working Commands:** {len(successful_commands)}\n"
+            "\n"
+            "---\n"
+            "\n"
+            "## 📊 Summary\n"
+            "\n"
+            f"✅ **{len(successful_commands)} commands are working correctly**\n"
+        )
+        write(_SUMMARY_TAIL)
 
         # Group commands by source for better organization
         by_source = {}
@@ -115,40 +163,18 @@ class DoneMDReporter(BaseReporter):
         for source, source_commands in sorted(by_source.items()):
             # Format source path for display
             display_source = self._format_source_link(source, project_path)
-            content.extend([f"### 📄 From {display_source}", ""])
+            write(f"### 📄 From {display_source}\n\n")
 
             for cmd in source_commands:
-                execution_time = cmd.get("execution_time", 0)
-                content.extend(
-                    [
-                        f"#### ✅ {cmd.get('description', 'Unnamed command')}",
-                        "",
-                        f"**Command:** `{cmd.get('command', '')}`",
-                        f"**Execution Time:** {execution_time:.2f}s",
-                        f"**Type:** {cmd.get('type', 'unknown')}",
-                        "",
-                        "**Status:** 🟢 **WORKING**",
-                        "",
-                        "---",
-                        "",
-                    ]
+                write(
+                    _COMMAND_TEMPLATE.format(
+                        description=cmd.get("description", "Unnamed command"),
+                        command=cmd.get("command", ""),
+                        execution_time=cmd.get("execution_time", 0),
+                        type=cmd.get("type", "unknown"),
+                    )
                 )
 
-        content.extend(
-            [
-                "",
-                "## 🔄 Updating This File",
-                "",
-                "This file is automatically updated when commands are tested.",
-                "To refresh the status:",
-                "",
-                "1. Run: `domd` to test all commands",
-                "2. Working commands will appear here",
-                "3. Failed commands will be moved to [TODO.md](TODO.md) for fixing",
-                "",
-                f"**Last test run:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                "",
-            ]
-        )
-
-        return "\n".join(content)
+        write(_FOOTER)
+        write(f"**Last test run:** {now_timestamp()}\n")
+        return ""
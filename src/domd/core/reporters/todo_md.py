@@ -1,11 +1,159 @@
 """Markdown reporter for TODO.md generation."""
 
-import datetime
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sized,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from domd.utils.time_utils import now_timestamp
 
 from .base import BaseReporter
 
+# Error output fragments with specific fix suggestions, matched in one pass
+_ERROR_PATTERNS_RE = re.compile(
+    "command not found|no such file or directory|permission denied", re.IGNORECASE
+)
+
+
+def _render_task_chunk(args: Tuple) -> str:
+    """Render a slice of the TODO.md tasks (runs in a worker process).
+
+    Args:
+        args: Reporter, failed commands, number of the first task, total
+            number of tasks and base path for relative source paths
+
+    Returns:
+        The rendered task sections
+    """
+    reporter, commands, start, total, project_path = args
+    buffer = io.StringIO()
+    reporter._write_tasks(buffer.write, commands, start, total, project_path)
+    return buffer.getvalue()
+
+
+# Number of distinct suggestion lists remembered; failures in one project
+# tend to repeat the same few errors
+SUGGESTIONS_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=SUGGESTIONS_CACHE_SIZE)
+def _suggestions_for(found: FrozenSet[str], cmd_name: str) -> Tuple[str, ...]:
+    """Build the fix suggestions for the error patterns found in a failure.
+
+    Args:
+        found: Lowercased error patterns found in the error output
+        cmd_name: Name of the failed program, used for "command not found"
+
+    Returns:
+        Fix suggestions, in rule order
+    """
+    suggestions = []
+
+    # Common error patterns
+    if "command not found" in found:
+        suggestions.append(f"Check if `{cmd_name}` is installed and in your PATH")
+        suggestions.append(f"Install the required package that provides `{cmd_name}`")
+
+    if "no such file or directory" in found:
+        suggestions.append("Verify the file or directory exists")
+        suggestions.append("Check for typos in the path")
+
+    if "permission denied" in found:
+        suggestions.append("Check file permissions")
+        suggestions.append("Make the file executable if needed: `chmod +x <file>`")
+
+    if not suggestions:
+        suggestions = [
+            "Check the command syntax and arguments",
+            "Verify all required dependencies are installed",
+            "Check for any environment variables that might be needed",
+            "Look for typos or missing files",
+        ]
+
+    return tuple(suggestions)
+
+
+# Static part of the report preceding the status section
+_HEADER = """\
+# 🤖 TODO - LLM Task List for Command Fixes
+
+**📋 INSTRUCTIONS FOR LLM:**
+This file contains a list of broken commands that need to be fixed.
+Each task is a separate command that failed during testing.
+
+**🎯 YOUR MISSION:**
+1. **Analyze each failed command** and its error output
+2. **Identify the root cause** of the failure
+3. **Implement the fix** by modifying source code, config files, or dependencies
+4. **Test the fix** by running the command manually
+5. **Update progress** - when a command starts working, it will be moved to DONE.md automatically
+
+**📝 TASK FORMAT:**
+Each task has:
+- ❌ **Command** that failed
+- 📁 **Source file** where the command is defined (clickable for .md files)
+- 🔴 **Error output** with full details
+- 💡 **Suggested actions** for fixing
+
+**🔄 WORKFLOW:**
+1. Pick a task from the list below
+2. Read the error details carefully
+3. Implement the fix
+4. Run `domd` to retest all commands
+5. Fixed commands will automatically move to DONE.md
+
+---
+
+"""
+
+# One failed command, up to its fix suggestions
+_TASK_TEMPLATE = """\
+### [ ] Task {i}: {description}
+
+**📋 Command:** `{command}`
+**📁 Source:** {source}
+**⏱️ Timeout:** {timeout}s
+**🔴 Return Code:** {return_code}
+**⚡ Execution Time:** {execution_time:.2f}s
+
+#### 🔴 Error Output:
+
+```bash
+# Command that failed:
+{command}
+
+# Error output:
+{error}
+```
+
+#### 💡 Suggested Fix Actions:
+
+"""
+
+_ALL_WORKING = """\
+## 🎉 All Commands Working!
+
+✅ **No failed commands found!**
+
+All project commands are working correctly.
+Check DONE.md for the list of working commands.
+"""
+
 
 class TodoMDReporter(BaseReporter):
     """Generates a TODO.md file with failed commands and fix suggestions."""
@@ -33,20 +181,22 @@ class TodoMDReporter(BaseReporter):
         if not path:
             return "unknown"
 
-        try:
-            path_obj = Path(path)
-            base_path = Path(base_path) if base_path else Path.cwd()
+        path_str = os.path.normpath(path)
+
+        # If it's already a relative path, return as is
+        if not os.path.isabs(path_str):
+            return path_str
 
-            # If it's already a relative path, return as is
-            if not path_obj.is_absolute():
-                return str(path_obj)
+        # Try to make it relative to the project
+        base_str = os.path.normpath(base_path) if base_path else os.getcwd()
+        if path_str == base_str:
+            return "."
+        prefix = base_str if base_str.endswith(os.sep) else base_str + os.sep
+        if path_str.startswith(prefix):
+            return path_str[len(prefix) :]
 
-            # Try to make it relative to the project
-            rel_path = path_obj.relative_to(base_path)
-            return str(rel_path)
-        except (ValueError, TypeError):
-            # If we can't make it relative, return just the filename
-            return str(Path(path).name) if path else "unknown"
+        # If we can't make it relative, return just the filename
+        return os.path.basename(path_str)
 
     def _format_source_link(
         self, source: str, base_path: Optional[Union[str, Path]] = None
@@ -66,118 +216,124 @@ class TodoMDReporter(BaseReporter):
         rel_path = self._get_relative_path(source, base_path)
 
         # Only create links for markdown files
-        if str(rel_path).lower().endswith(".md"):
+        if rel_path.lower().endswith(".md"):
             return f"[{rel_path}]({rel_path})"
         return rel_path
 
-    def generate_report(self, data: Dict) -> str:
+    def generate_report(
+        self, data: Dict, stream: Optional[TextIO] = None, workers: int = 1
+    ) -> str:
         """Generate the TODO.md content.
 
         Args:
-            data: Dictionary containing 'failed_commands' and other metadata
+            data: Dictionary containing 'failed_commands' and other metadata.
+                'failed_commands' may be any iterable; together with
+                'failed_count' (and 'successful_count' instead of
+                'successful_commands') it is rendered as it is consumed.
+            stream: Writable text stream to write the content to as it is
+                generated, instead of building it in memory
+            workers: Number of processes rendering the tasks; only worth it
+                for tens of thousands of failed commands
 
         Returns:
-            Formatted markdown content
+            Formatted markdown content, or an empty string if it was written
+            to ``stream``
         """
-        failed_commands = data.get("failed_commands", [])
-        successful_commands = data.get("successful_commands", [])
-        project_path = data.get("project_path")
-
-        content = [
-            "# 🤖 TODO - LLM Task List for Command Fixes",
-            "",
-            "**📋 INSTRUCTIONS FOR LLM:**",
-            "This file contains a list of broken commands that need to be fixed.",
-            "Each task is a separate command that failed during testing.",
-            "",
-            "**🎯 YOUR MISSION:**",
-            "1. **Analyze each failed command** and its error output",
-            "2. **Identify the root cause** of the failure",
-            "3. **Implement the fix** by modifying source code, config files, or dependencies",
-            "4. **Test the fix** by running the command manually",
-            "5. **Update progress** - when a command starts working, it will be moved to DONE.md automatically",
-            "",
-            "**📝 TASK FORMAT:**",
-            "Each task has:",
-            "- ❌ **Command** that failed",
-            "- 📁 **Source file** where the command is defined (clickable for .md files)",
-            "- 🔴 **Error output** with full details",
-            "- 💡 **Suggested actions** for fixing",
-            "",
-            "**🔄 WORKFLOW:**",
-            "1. Pick a task from the list below",
-            "2. Read the error details carefully",
-            "3. Implement the fix",
-            "4. Run `domd` to retest all commands",
-            "5. Fixed commands will automatically move to DONE.md",
-            "",
-            "---",
-            "",
-            "**📊 Current Status:**",
-            f"- **Failed Commands:** {len(failed_commands)}",
-            f"- **Working Commands:** {len(successful_commands)} (see [DONE.md](DONE.md))",
-            f"- **Last Updated:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "---",
-            "",
-        ]
-
-        if not failed_commands:
-            content.extend(
-                [
-                    "## 🎉 All Commands Working!",
-                    "",
-                    "✅ **No failed commands found!**",
-                    "",
-                    "All project commands are working correctly.",
-                    "Check DONE.md for the list of working commands.",
-                    "",
-                ]
-            )
+        if stream is None:
+            buffer = io.StringIO()
+            self.generate_report(data, buffer, workers)
+            return buffer.getvalue()
+
+        failed_commands = data.get("failed_commands") or ()
+        failed_count = data.get("failed_count")
+        if failed_count is None:
+            if not isinstance(failed_commands, Sized):
+                failed_commands = list(failed_commands)
+            failed_count = len(failed_commands)
+        successful_count = data.get("successful_count")
+        if successful_count is None:
+            successful_count = len(data.get("successful_commands") or ())
+        # Base for relative source paths, looked up once per report
+        project_path = data.get("project_path") or os.getcwd()
+        write = stream.write
+
+        write(_HEADER)
+        write(
+            "**📊 Current Status:**\n"
+            f"- **Failed Commands:** {failed_count}\n"
+            f"- **Working Commands:** {successful_count} (see [DONE.md](DONE.md))\n"
+            f"- **Last Updated:** {now_timestamp()}\n"
+            "\n"
+            "---\n"
+            "\n"
+        )
+
+        if not failed_count:
+            write(_ALL_WORKING)
+            return ""
+
+        write(
+            f"## 🔧 Tasks to Fix ({failed_count} commands)\n"
+            "\n"
+            "Each section below is a separate task. Fix them one by one:\n"
+            "\n"
+        )
+
+        if workers > 1 and failed_count > 1:
+            # Render contiguous slices of the tasks in worker processes
+            if not isinstance(failed_commands, list):
+                failed_commands = list(failed_commands)
+            size = -(-len(failed_commands) // workers)
+            chunks = [
+                (self, failed_commands[i : i + size], i + 1, failed_count, project_path)
+                for i in range(0, len(failed_commands), size)
+            ]
+            with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+                for text in pool.map(_render_task_chunk, chunks):
+                    write(text)
         else:
-            content.extend(
-                [
-                    f"## 🔧 Tasks to Fix ({len(failed_commands)} commands)",
-                    "",
-                    "Each section below is a separate task. Fix them one by one:",
-                    "",
-                ]
-            )
+            self._write_tasks(write, failed_commands, 1, failed_count, project_path)
 
-            for i, cmd in enumerate(failed_commands, 1):
-                content.extend(
-                    [
-                        f"### [ ] Task {i}: {cmd.get('description', 'Unnamed command')}",
-                        "",
-                        f"**📋 Command:** `{cmd.get('command', '')}`",
-                        f"**📁 Source:** {self._format_source_link(cmd.get('source'), project_path)}",
-                        f"**⏱️ Timeout:** {cmd.get('timeout', 'N/A')}s",
-                        f"**🔴 Return Code:** {cmd.get('return_code', 'N/A')}",
-                        f"**⚡ Execution Time:** {cmd.get('execution_time', 0):.2f}s",
-                        "",
-                        "#### 🔴 Error Output:",
-                        "",
-                        "```bash",
-                        "# Command that failed:",
-                        cmd.get("command", ""),
-                        "",
-                        "# Error output:",
-                        cmd.get("error", "No error output captured"),
-                        "```",
-                        "",
-                        "#### 💡 Suggested Fix Actions:",
-                        "",
-                    ]
-                )
+        return ""
 
-                # Add any specific fix suggestions
-                suggestions = self._generate_fix_suggestions(cmd)
-                for suggestion in suggestions:
-                    content.append(f"- [ ] {suggestion}")
+    def _write_tasks(
+        self,
+        write: Callable[[str], Any],
+        commands: Iterable[Dict],
+        start: int,
+        total: int,
+        project_path: Union[str, Path],
+    ) -> None:
+        """Write the task sections for failed commands.
+
+        Args:
+            write: Function writing a piece of the report
+            commands: Failed command dictionaries
+            start: Task number of the first command
+            total: Number of tasks in the whole report
+            project_path: Base path for relative source paths
+        """
+        for i, cmd in enumerate(commands, start):
+            command = cmd.get("command", "")
+            write(
+                _TASK_TEMPLATE.format(
+                    i=i,
+                    description=cmd.get("description", "Unnamed command"),
+                    command=command,
+                    source=self._format_source_link(cmd.get("source"), project_path),
+                    timeout=cmd.get("timeout", "N/A"),
+                    return_code=cmd.get("return_code", "N/A"),
+                    execution_time=cmd.get("execution_time", 0),
+                    error=cmd.get("error", "No error output captured"),
+                )
+            )
 
-                content.extend(["", "---", ""])
+            # Add any specific fix suggestions
+            for suggestion in self._generate_fix_suggestions(cmd):
+                write(f"- [ ] {suggestion}\n")
 
-        return "\n".join(content)
+            # The report ends right after the last separator
+            write("\n---\n" if i == total else "\n---\n\n")
 
     def _generate_fix_suggestions(self, cmd: Dict) -> List[str]:
         """Generate specific fix suggestions based on command and error.
@@ -188,32 +344,16 @@ class TodoMDReporter(BaseReporter):
         Returns:
             List of fix suggestions
         """
-        suggestions = []
-        error = (cmd.get("error") or "").lower()
-        command = (cmd.get("command") or "").lower()
-
-        # Common error patterns
-        if "command not found" in error:
-            cmd_name = command.split()[0] if command else "the command"
-            suggestions.append(f"Check if `{cmd_name}` is installed and in your PATH")
-            suggestions.append(
-                f"Install the required package that provides `{cmd_name}`"
-            )
-
-        if "no such file or directory" in error:
-            suggestions.append("Verify the file or directory exists")
-            suggestions.append("Check for typos in the path")
-
-        if "permission denied" in error:
-            suggestions.append("Check file permissions")
-            suggestions.append("Make the file executable if needed: `chmod +x <file>`")
-
-        if not suggestions:
-            suggestions = [
-                "Check the command syntax and arguments",
-                "Verify all required dependencies are installed",
-                "Check for any environment variables that might be needed",
-                "Look for typos or missing files",
-            ]
-
-        return suggestions
+        # One scan of the error output finds every known error pattern
+        found = frozenset(
+            match.lower()
+            for match in _ERROR_PATTERNS_RE.findall(cmd.get("error") or "")
+        )
+
+        cmd_name = ""
+        if "command not found" in found:
+            # Only the program name is needed, so only it is lowercased
+            parts = (cmd.get("command") or "").split(maxsplit=1)
+            cmd_name = parts[0].lower() if parts else "the command"
+
+        return list(_suggestions_for(found, cmd_name))
@@ -2,15 +2,97 @@
 
 import json
 import logging
+import os
 from abc import ABC, abstractmethod
-from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
-
+from typing import (
+    IO,
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from domd.utils.file_utils import open_for_replace
 from domd.utils.path_utils import safe_path_display
+from domd.utils.time_utils import now_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Markdown report entries, one template per command section
+_FAILED_COMMAND_ENTRY = (
+    "### {i}. `{command}`\n"
+    "\n"
+    "**Source:** {source}\n"
+    "**Exit Code:** {return_code}\n"
+    "\n"
+    "#### Error Output\n"
+    "```\n"
+    "{error}\n"
+    "```\n"
+)
+_SUCCESSFUL_COMMAND_ENTRY = (
+    "### {i}. `{command}`\n"
+    "\n"
+    "**Source:** {source}\n"
+    "**Duration:** {execution_time:.2f}s\n"
+)
+_IGNORED_COMMAND_ENTRY = (
+    "### {i}. `{command}`\n\n**Source:** {source}\n**Reason:** {reason}\n"
+)
+
+# ANSI escape codes used by ConsoleFormatter
+_ANSI_COLORS = {
+    "red": "\033[91m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "blue": "\033[94m",
+    "magenta": "\033[95m",
+    "cyan": "\033[96m",
+    "white": "\033[97m",
+    "reset": "\033[0m",
+    "bold": "\033[1m",
+    "underline": "\033[4m",
+}
+
+
+def _color_text(text: str, color: str, use_color: bool = True) -> str:
+    """Wrap text in ANSI color codes.
+
+    Args:
+        text: Text to color
+        color: Name of the color, see ``_ANSI_COLORS``
+        use_color: Return the text unchanged if False
+
+    Returns:
+        The colored text
+    """
+    if not use_color:
+        return text
+    return f"{_ANSI_COLORS.get(color, '')}{text}{_ANSI_COLORS['reset']}"
+
+
+# Write buffer for report files, so streamed reports reach the disk in a
+# few large writes rather than one per line
+REPORT_WRITE_BUFFER_SIZE = 128 * 1024
+
+
+def _open_report(output_path: Path) -> ContextManager[IO]:
+    """Open a report file for writing, see :func:`open_for_replace`.
+
+    Args:
+        output_path: Path of the report to write
+
+    Returns:
+        Context manager yielding the text file to write the report to
+    """
+    return open_for_replace(output_path, buffering=REPORT_WRITE_BUFFER_SIZE)
+
 
 class BaseFormatter(ABC):
     """Base class for all formatters."""
@@ -36,6 +118,20 @@ class BaseFormatter(ABC):
         """
         raise NotImplementedError("Subclasses must implement format_report()")
 
+    def format_reports(
+        self, reports: Iterable[Dict[str, Any]], **kwargs: Any
+    ) -> List[str]:
+        """Format several reports that share the same options.
+
+        Args:
+            reports: Report data for each report to format
+            **kwargs: Formatting options applied to every report
+
+        Returns:
+            Formatted reports, in the order given
+        """
+        return [self.format_report(data, **kwargs) for data in reports]
+
     def write_report(
         self, data: Dict[str, Any], output_path: Union[str, Path], **kwargs: Any
     ) -> None:
@@ -52,7 +148,8 @@ class BaseFormatter(ABC):
         formatted = self.format_report(data, **kwargs)
 
         try:
-            output_path.write_text(formatted, encoding="utf-8")
+            with _open_report(output_path) as f:
+                f.write(formatted)
             logger.info("Report written to %s", output_path)
         except IOError as e:
             logger.error("Failed to write report to %s: %s", output_path, e)
@@ -62,79 +159,62 @@ class BaseFormatter(ABC):
 class MarkdownFormatter(BaseFormatter):
     """Formatter for Markdown output."""
 
-    def _format_path(
-        self, path: Optional[str], base_path: Optional[Path] = None
-    ) -> str:
-        """Format a path for display in the report.
+    def format_reports(
+        self, reports: Iterable[Dict[str, Any]], **kwargs: Any
+    ) -> List[str]:
+        """Format several Markdown reports stamped with the same time.
 
         Args:
-            path: The path to format
-            base_path: Base path to make relative to
+            reports: Report data for each report to format
+            **kwargs: Formatting options, as for :meth:`format_report`
 
         Returns:
-            Formatted path string
+            Formatted Markdown reports, in the order given
         """
-        if not path:
-            return ""
+        if kwargs.get("timestamp", True) and not kwargs.get("generated_on"):
+            kwargs["generated_on"] = now_timestamp()
+        return super().format_reports(reports, **kwargs)
 
-        try:
-            # If it's already a relative path, return as is
-            if not os.path.isabs(path):
-                return path
-
-            # Make path relative to base_path if provided
-            if base_path and base_path.exists():
-                try:
-                    return str(Path(path).relative_to(base_path))
-                except ValueError:
-                    pass
-
-            # Fall back to safe display
-            return safe_path_display(path, base_path)
-        except Exception as e:
-            logger.debug(f"Error formatting path '{path}': {e}")
-            return str(path)
-
-    def _format_command(
-        self, cmd: Dict[str, Any], base_path: Optional[Path] = None
-    ) -> Dict[str, Any]:
-        """Format command data for display.
+    def format_report(self, data: Dict[str, Any], **kwargs: Any) -> str:
+        """Format the report as Markdown.
 
         Args:
-            cmd: Command data dictionary
-            base_path: Base path for making paths relative
+            data: Report data to format
+            **kwargs: Formatting options, as for :meth:`iter_report_lines`
 
         Returns:
-            Formatted command data
+            Formatted Markdown report
         """
-        if not cmd:
-            return {}
-
-        # Create a copy to avoid modifying the original
-        formatted = dict(cmd)
+        return "\n".join(self.iter_report_lines(data, **kwargs))
 
-        # Format paths in command output
-        for field in ["stdout", "stderr", "output"]:
-            if field in formatted and formatted[field]:
-                formatted[field] = self._format_path(str(formatted[field]), base_path)
+    def write_report(
+        self, data: Dict[str, Any], output_path: Union[str, Path], **kwargs: Any
+    ) -> None:
+        """Write the Markdown report to a file line by line.
 
-        # Format source and cwd if they exist
-        for field in ["source", "cwd"]:
-            if field in formatted and formatted[field]:
-                formatted[field] = self._format_path(str(formatted[field]), base_path)
+        The report is streamed to the file instead of being built as one
+        string first.
 
-        # Format metadata paths if present
-        if "metadata" in formatted and formatted["metadata"]:
-            metadata = dict(formatted["metadata"])
-            for key, value in metadata.items():
-                if isinstance(value, str) and os.path.isabs(value):
-                    metadata[key] = self._format_path(value, base_path)
-            formatted["metadata"] = metadata
+        Args:
+            data: Report data to format
+            output_path: Path to write the report to
+            **kwargs: Additional formatting options
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        return formatted
+        lines = self.iter_report_lines(data, **kwargs)
+        try:
+            with _open_report(output_path) as f:
+                f.write(next(lines, ""))
+                f.writelines(f"\n{line}" for line in lines)
+            logger.info("Report written to %s", output_path)
+        except IOError as e:
+            logger.error("Failed to write report to %s: %s", output_path, e)
+            raise
 
-    def format_report(self, data: Dict[str, Any], **kwargs: Any) -> str:
-        """Format the report as Markdown.
+    def iter_report_lines(self, data: Dict[str, Any], **kwargs: Any) -> Iterator[str]:
+        """Generate the Markdown report block by block.
 
         Args:
             data: Report data to format
@@ -144,113 +224,77 @@ class MarkdownFormatter(BaseFormatter):
                 - include_successful: Include successful commands (default: True)
                 - include_failed: Include failed commands (default: True)
                 - include_ignored: Include ignored commands (default: False)
-                - base_path: Base path for making paths relative
+                - generated_on: Preformatted timestamp (default: now)
 
-        Returns:
-            Formatted Markdown report
+        Yields:
+            Blocks of the Markdown report (a heading, the summary or one
+            command entry), each without its final line ending
         """
         title = kwargs.get("title", "Command Execution Report")
         include_timestamp = kwargs.get("timestamp", True)
         include_successful = kwargs.get("include_successful", True)
         include_failed = kwargs.get("include_failed", True)
         include_ignored = kwargs.get("include_ignored", False)
-        base_path = kwargs.get("base_path")
-        if base_path and not isinstance(base_path, Path):
-            base_path = Path(base_path)
 
-        lines = [f"# {title}", ""]
+        yield f"# {title}\n"
 
         if include_timestamp:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            lines.extend([f"*Generated on {timestamp}*", ""])
-
-        # Format command data
-        commands = [
-            self._format_command(cmd, base_path) for cmd in data.get("commands", [])
-        ]
-        successful_commands = [
-            self._format_command(cmd, base_path)
-            for cmd in data.get("successful_commands", [])
-        ]
-        failed_commands = [
-            self._format_command(cmd, base_path)
-            for cmd in data.get("failed_commands", [])
-        ]
-        ignored_commands = [
-            self._format_command(cmd, base_path)
-            for cmd in data.get("ignored_commands", [])
-        ]
-
-        # Update counts after formatting
-        total = len(commands)
-        successful = len(successful_commands)
-        failed = len(failed_commands)
-        ignored = len(ignored_commands)
-
-        lines.extend(
-            [
-                "## Summary",
-                "",
-                f"- **Total commands:** {total}",
-                f"- **✅ Successful:** {successful}",
-                f"- **❌ Failed:** {failed}",
-                f"- **⏭️ Ignored:** {ignored}",
-                "",
-            ]
+            timestamp = kwargs.get("generated_on") or now_timestamp()
+            yield f"*Generated on {timestamp}*\n"
+
+        # Look the command lists up once; the sections below render the raw
+        # entries
+        commands = data.get("commands") or ()
+        successful = data.get("successful_commands") or ()
+        failed = data.get("failed_commands") or ()
+        ignored = data.get("ignored_commands") or ()
+
+        yield (
+            "## Summary\n"
+            "\n"
+            f"- **Total commands:** {len(commands)}\n"
+            f"- **✅ Successful:** {len(successful)}\n"
+            f"- **❌ Failed:** {len(failed)}\n"
+            f"- **⏭️ Ignored:** {len(ignored)}\n"
         )
 
         # Failed commands section
-        if include_failed and data.get("failed_commands"):
-            lines.extend(["## ❌ Failed Commands", ""])
-
-            for i, cmd in enumerate(data["failed_commands"], 1):
-                lines.extend(
-                    [
-                        f"### {i}. `{cmd.get('command', '')}`",
-                        "",
-                        f"**Source:** {cmd.get('source', 'Unknown')}",
-                        f"**Exit Code:** {cmd.get('return_code', '?')}",
-                        "",
-                        "#### Error Output",
-                        "```",
-                        cmd.get("error", "No error output").strip(),
-                        "```",
-                        "",
-                    ]
+        if include_failed and failed:
+            yield "## ❌ Failed Commands\n"
+
+            for i, cmd in enumerate(failed, 1):
+                yield _FAILED_COMMAND_ENTRY.format(
+                    i=i,
+                    command=cmd.get("command", ""),
+                    source=cmd.get("source", "Unknown"),
+                    return_code=cmd.get("return_code", "?"),
+                    error=cmd.get("error", "No error output").strip(),
                 )
 
         # Successful commands section
-        if include_successful and data.get("successful_commands"):
-            lines.extend(["## ✅ Successful Commands", ""])
-
-            for i, cmd in enumerate(data["successful_commands"], 1):
-                lines.extend(
-                    [
-                        f"### {i}. `{cmd.get('command', '')}`",
-                        "",
-                        f"**Source:** {cmd.get('source', 'Unknown')}",
-                        f"**Duration:** {cmd.get('execution_time', 0):.2f}s",
-                        "",
-                    ]
+        if include_successful and successful:
+            yield "## ✅ Successful Commands\n"
+
+            for i, cmd in enumerate(successful, 1):
+                yield _SUCCESSFUL_COMMAND_ENTRY.format(
+                    i=i,
+                    command=cmd.get("command", ""),
+                    source=cmd.get("source", "Unknown"),
+                    execution_time=cmd.get("execution_time", 0),
                 )
 
         # Ignored commands section
-        if include_ignored and data.get("ignored_commands"):
-            lines.extend(["## ⏭️ Ignored Commands", ""])
-
-            for i, cmd in enumerate(data["ignored_commands"], 1):
-                lines.extend(
-                    [
-                        f"### {i}. `{cmd.get('command', '')}`",
-                        "",
-                        f"**Source:** {cmd.get('source', 'Unknown')}",
-                        f"**Reason:** {cmd.get('ignore_reason', 'Not specified')}",
-                        "",
-                    ]
+        if include_ignored and ignored:
+            yield "## ⏭️ Ignored Commands\n"
+
+            for i, cmd in enumerate(ignored, 1):
+                yield _IGNORED_COMMAND_ENTRY.format(
+                    i=i,
+                    command=cmd.get("command", ""),
+                    source=cmd.get("source", "Unknown"),
+                    reason=cmd.get("ignore_reason", "Not specified"),
                 )
 
-        return "\n".join(lines)
-
 
 class JsonFormatter(BaseFormatter):
     """Formatter for JSON output."""
@@ -267,13 +311,72 @@ class JsonFormatter(BaseFormatter):
         Returns:
             Formatted JSON report
         """
-        # Make a deep copy to avoid modifying the original data
-        import copy
+        encoder = self._encoder(kwargs.get("pretty", True))
+        return encoder.encode(self._format_data(data, kwargs.get("base_path")))
+
+    def write_report(
+        self, data: Dict[str, Any], output_path: Union[str, Path], **kwargs: Any
+    ) -> None:
+        """Write the JSON report to a file.
+
+        Pretty-printed JSON is encoded in pure Python anyway, so it is
+        streamed to the file chunk by chunk instead of being built as one
+        string first.
+
+        Args:
+            data: Report data to format
+            output_path: Path to write the report to
+            **kwargs: Formatting options, as for :meth:`format_report`
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        formatted_data = copy.deepcopy(data)
+        formatted_data = self._format_data(data, kwargs.get("base_path"))
+        encoder = self._encoder(kwargs.get("pretty", True))
+        if encoder.indent is None:
+            # Compact JSON has a C fast path for one-shot encoding
+            chunks = [encoder.encode(formatted_data)]
+        else:
+            chunks = encoder.iterencode(formatted_data)
+
+        try:
+            with _open_report(output_path) as f:
+                f.writelines(chunks)
+            logger.info("Report written to %s", output_path)
+        except IOError as e:
+            logger.error("Failed to write report to %s: %s", output_path, e)
+            raise
+
+    @staticmethod
+    def _encoder(pretty: bool) -> json.JSONEncoder:
+        """Create the JSON encoder for the report.
+
+        Args:
+            pretty: Whether to pretty-print the JSON
+
+        Returns:
+            Encoder producing the same output as ``json.dumps``
+        """
+        return json.JSONEncoder(indent=2 if pretty else None, ensure_ascii=False)
+
+    def _format_data(
+        self, data: Dict[str, Any], base_path: Optional[Union[str, Path]] = None
+    ) -> Dict[str, Any]:
+        """Prepare report data for JSON output.
+
+        Only the parts that are rewritten are copied, so the original data
+        is left unchanged without deep-copying it.
+
+        Args:
+            data: Report data to format
+            base_path: Base path for making paths relative
+
+        Returns:
+            Report data with display paths
+        """
+        formatted_data = dict(data)
 
         # Get base path for relative paths
-        base_path = kwargs.get("base_path")
         if base_path and not isinstance(base_path, Path):
             base_path = Path(base_path)
 
@@ -293,14 +396,13 @@ class JsonFormatter(BaseFormatter):
 
         # Format any other paths in the data
         if "metadata" in formatted_data and "paths" in formatted_data["metadata"]:
+            formatted_data["metadata"] = dict(formatted_data["metadata"])
             formatted_data["metadata"]["paths"] = {
                 k: self._format_path(v, base_path)
                 for k, v in formatted_data["metadata"]["paths"].items()
             }
 
-        pretty = kwargs.get("pretty", True)
-        indent = 2 if pretty else None
-        return json.dumps(formatted_data, indent=indent, ensure_ascii=False)
+        return formatted_data
 
     def _format_path(
         self, path: Optional[str], base_path: Optional[Path] = None
@@ -392,24 +494,19 @@ class ConsoleFormatter(BaseFormatter):
         verbose = kwargs.get("verbose", False)
         use_color = kwargs.get("color", True)
 
-        def color_text(text: str, color: str) -> str:
-            """Wrap text in ANSI color codes."""
-            if not use_color:
-                return text
-
-            colors = {
-                "red": "\033[91m",
-                "green": "\033[92m",
-                "yellow": "\033[93m",
-                "blue": "\033[94m",
-                "magenta": "\033[95m",
-                "cyan": "\033[96m",
-                "white": "\033[97m",
-                "reset": "\033[0m",
-                "bold": "\033[1m",
-                "underline": "\033[4m",
-            }
-            return f"{colors.get(color, '')}{text}{colors['reset']}"
+        color_text = partial(_color_text, use_color=use_color)
+
+        # Labels repeated for every command are colored once per report; the
+        # task numbers only need the escape codes around them
+        source_label = color_text("Source:", "cyan")
+        exit_code_label = color_text("Exit Code:", "cyan")
+        error_label = color_text("Error:", "red")
+        duration_label = color_text("Duration:", "cyan")
+        reason_label = color_text("Reason:", "yellow")
+        if use_color:
+            number_start, number_end = _ANSI_COLORS["red"], _ANSI_COLORS["reset"]
+        else:
+            number_start = number_end = ""
 
         lines = []
 
@@ -419,56 +516,50 @@ class ConsoleFormatter(BaseFormatter):
         lines.append(color_text("=" * 40, "blue"))
 
         # Summary
-        total = len(data.get("commands", []))
-        successful = len(data.get("successful_commands", []))
-        failed = len(data.get("failed_commands", []))
-        ignored = len(data.get("ignored_commands", []))
+        commands = data.get("commands") or ()
+        successful = data.get("successful_commands") or ()
+        failed = data.get("failed_commands") or ()
+        ignored = data.get("ignored_commands") or ()
 
         lines.append(color_text("\nSUMMARY", "bold"))
-        lines.append(f"Total commands:  {total}")
-        lines.append(f"{color_text('✅ Successful:', 'green')}  {successful}")
-        lines.append(f"{color_text('❌ Failed:', 'red')}  {failed}")
-        lines.append(f"{color_text('⏭️ Ignored:', 'yellow')}  {ignored}")
+        lines.append(f"Total commands:  {len(commands)}")
+        lines.append(f"{color_text('✅ Successful:', 'green')}  {len(successful)}")
+        lines.append(f"{color_text('❌ Failed:', 'red')}  {len(failed)}")
+        lines.append(f"{color_text('⏭️ Ignored:', 'yellow')}  {len(ignored)}")
 
         # Failed commands
-        if data.get("failed_commands"):
+        if failed:
             lines.append(color_text("\nFAILED COMMANDS", "bold"))
 
-            for i, cmd in enumerate(data["failed_commands"], 1):
-                lines.extend(
-                    [
-                        f"\n{color_text(f'{i}.', 'red')} {cmd.get('command', '')}",
-                        f"  {color_text('Source:', 'cyan')} {cmd.get('source', 'Unknown')}",
-                        f"  {color_text('Exit Code:', 'cyan')} {cmd.get('return_code', '?')}",
-                        f"  {color_text('Error:', 'red')}",
-                        f"  {cmd.get('error', 'No error output').strip()}",
-                    ]
+            for i, cmd in enumerate(failed, 1):
+                lines.append(
+                    f"\n{number_start}{i}.{number_end} {cmd.get('command', '')}\n"
+                    f"  {source_label} {cmd.get('source', 'Unknown')}\n"
+                    f"  {exit_code_label} {cmd.get('return_code', '?')}\n"
+                    f"  {error_label}\n"
+                    f"  {cmd.get('error', 'No error output').strip()}"
                 )
 
         # Verbose output for successful commands
-        if verbose and data.get("successful_commands"):
+        if verbose and successful:
             lines.append(color_text("\nSUCCESSFUL COMMANDS", "bold"))
 
-            for i, cmd in enumerate(data["successful_commands"], 1):
-                lines.extend(
-                    [
-                        f"\n{i}. {cmd.get('command', '')}",
-                        f"  {color_text('Source:', 'cyan')} {cmd.get('source', 'Unknown')}",
-                        f"  {color_text('Duration:', 'cyan')} {cmd.get('execution_time', 0):.2f}s",
-                    ]
+            for i, cmd in enumerate(successful, 1):
+                lines.append(
+                    f"\n{i}. {cmd.get('command', '')}\n"
+                    f"  {source_label} {cmd.get('source', 'Unknown')}\n"
+                    f"  {duration_label} {cmd.get('execution_time', 0):.2f}s"
                 )
 
         # Ignored commands
-        if data.get("ignored_commands"):
+        if ignored:
             lines.append(color_text("\nIGNORED COMMANDS", "yellow"))
 
-            for i, cmd in enumerate(data["ignored_commands"], 1):
-                lines.extend(
-                    [
-                        f"\n{i}. {cmd.get('command', '')}",
-                        f"  {color_text('Source:', 'cyan')} {cmd.get('source', 'Unknown')}",
-                        f"  {color_text('Reason:', 'yellow')} {cmd.get('ignore_reason', 'Not specified')}",
-                    ]
+            for i, cmd in enumerate(ignored, 1):
+                lines.append(
+                    f"\n{i}. {cmd.get('command', '')}\n"
+                    f"  {source_label} {cmd.get('source', 'Unknown')}\n"
+                    f"  {reason_label} {cmd.get('ignore_reason', 'Not specified')}"
                 )
 
         return "\n".join(lines)
@@ -1,4 +1,73 @@
-# Narzędzia do plików
-"""
-file_utils.py
-"""
+"""Utility functions for writing files in DoMD."""
+
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Union
+
+
+def _default_file_mode() -> int:
+    """Get the permissions ``open()`` gives newly created files.
+
+    Returns:
+        int: ``0o666`` without the bits masked by the process umask
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Read once at import: changing the umask briefly is not safe while other
+# threads create files
+_DEFAULT_FILE_MODE = _default_file_mode()
+
+
+@contextmanager
+def open_for_replace(
+    path: Union[str, Path], binary: bool = False, buffering: int = -1
+) -> Iterator[IO]:
+    """Open a temporary file that atomically replaces ``path`` when closed.
+
+    Readers never see a partially written file, and an interrupted write
+    leaves the previous file in place. Each call writes its own temporary
+    file, so concurrent writers do not corrupt each other's output. If
+    ``path`` is a symlink, the file it points to is replaced, and the
+    permissions of an existing file are kept.
+
+    Args:
+        path: Path of the file to write
+        binary: Open the file in binary mode instead of as UTF-8 text
+        buffering: Buffer size, as for ``open()``
+
+    Yields:
+        File object to write the content to
+    """
+    target = os.path.realpath(path)
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = _DEFAULT_FILE_MODE
+
+    directory, name = os.path.split(target)
+    tmp = tempfile.NamedTemporaryFile(
+        "wb" if binary else "w",
+        buffering=buffering,
+        encoding=None if binary else "utf-8",
+        dir=directory,
+        prefix=f".{name}.",
+        suffix=".tmp",
+        delete=False,
+    )
+    try:
+        with tmp as f:
+            yield f
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,32 @@
+"""Utility functions for timestamps in DoMD reports."""
+
+import time
+from datetime import datetime
+from typing import Tuple
+
+# Format of the timestamps shown in reports
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Last formatted timestamp as (seconds since the epoch, text)
+_last_timestamp: Tuple[int, str] = (-1, "")
+
+
+def now_timestamp() -> str:
+    """Get the current local time formatted for reports.
+
+    The text only changes once per second, so it is formatted once per
+    second and reused by every report generated within that second.
+
+    Returns:
+        str: The current time as ``YYYY-MM-DD HH:MM:SS``
+    """
+    global _last_timestamp
+
+    second = int(time.time())
+    cached = _last_timestamp
+    if cached[0] == second:
+        return cached[1]
+
+    text = datetime.fromtimestamp(second).strftime(TIMESTAMP_FORMAT)
+    _last_timestamp = (second, text)
+    return text
@@ -6,6 +6,7 @@ import sys
 import tempfile
 from pathlib import Path
 from typing import Optional
+from unittest.mock import patch
 
 import pytest
 
@@ -273,5 +274,59 @@ def test_custom_venv_path(temp_project):
     assert result["success"] is True
 
 
+def test_venv_environment_is_cached(venv_project):
+    """Test that the virtualenv environment is built once per venv path."""
+    detector = ProjectCommandDetector(project_path=venv_project)
+
+    env = detector._venv_env_base
+    assert detector._venv_env_base is env
+    assert env["VIRTUAL_ENV"] == detector.venv_info["path"]
+
+    # Changing the virtualenv path invalidates the cached environment
+    custom_venv = venv_project / "custom_venv"
+    create_mock_venv(str(custom_venv), sys.executable)
+    detector.venv_path = str(custom_venv)
+
+    new_env = detector._venv_env_base
+    assert new_env is not env
+    assert new_env["VIRTUAL_ENV"] == str(custom_venv)
+
+
+def test_venv_environment_captures_os_environ_once(venv_project):
+    """Test that os.environ is read when the cached environment is built."""
+    detector = ProjectCommandDetector(project_path=venv_project)
+    env = detector._venv_env_base
+
+    with patch.dict(os.environ, {"DOMD_TEST_VAR": "1"}):
+        assert detector._venv_env_base is env
+        assert "DOMD_TEST_VAR" not in env
+
+        detector.venv_info = detector.venv_info
+        assert detector._venv_env_base["DOMD_TEST_VAR"] == "1"
+
+
+def test_run_in_venv_reuses_prepared_environment(venv_project):
+    """Test that run_in_venv passes a read-only view of the cached environment."""
+    detector = ProjectCommandDetector(project_path=venv_project)
+    base_env = detector._venv_env_base
+
+    with patch.object(
+        detector.command_handler, "run_in_venv", return_value={"success": True}
+    ) as mock_run:
+        detector.run_in_venv(["python", "--version"])
+        detector.run_in_venv(["python", "--version"])
+
+    assert detector._venv_env_base is base_env
+    passed_env = mock_run.call_args.kwargs["venv_env"]
+    assert passed_env == base_env
+    assert passed_env is not base_env
+    with pytest.raises(TypeError):
+        passed_env["PATH"] = ""
+
+    # Reassigning venv_info drops the prepared environment
+    detector.venv_info = {"exists": False}
+    assert detector._venv_env_base is not base_env
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
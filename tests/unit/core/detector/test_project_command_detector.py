@@ -7,7 +7,11 @@ from unittest.mock import patch
 
 import pytest
 
-from domd.core.project_detection.detector import ProjectCommandDetector
+from domd.core.commands import Command
+from domd.core.project_detection.detector import (
+    CONTENT_CACHE_MAX_FILE_SIZE,
+    ProjectCommandDetector,
+)
 
 
 class TestProjectCommandDetector:
@@ -66,3 +70,190 @@ class TestProjectCommandDetector:
 
             assert commands == []
             mock_instance.find_config_files.assert_called_once()
+
+    @pytest.mark.unit
+    def test_load_ignore_patterns(self, temp_project):
+        """Test that .doignore patterns are compiled and applied to commands."""
+        (temp_project / ".doignore").write_text(
+            "# comment\n\nmake clean-*\ndocs\nre:^poetry (build|publish)\n"
+        )
+
+        detector = ProjectCommandDetector(str(temp_project))
+        detector._load_ignore_patterns()
+
+        assert detector.ignore_patterns == [
+            "make clean-*",
+            "docs",
+            "re:^poetry (build|publish)",
+        ]
+        assert detector.should_ignore_command("make clean-all")
+        assert detector.should_ignore_command("MAKE CLEAN-ALL")
+        assert detector.should_ignore_command("mkdocs build docs")
+        assert detector.should_ignore_command("poetry publish")
+        assert not detector.should_ignore_command("make clean")
+        assert not detector.should_ignore_command("make test")
+
+        # Reloading the patterns drops memoized results
+        (temp_project / ".doignore").write_text("make test\n")
+        detector._load_ignore_patterns()
+        assert detector.should_ignore_command("make test")
+        assert not detector.should_ignore_command("make clean-all")
+
+    @pytest.mark.unit
+    def test_process_file_commands_checks_each_result(self, temp_project):
+        """Test that mixed parser results are normalized or skipped per item."""
+        package_json = temp_project / "package.json"
+        package_json.write_text('{"scripts": {"test": "jest"}}')
+        detector = ProjectCommandDetector(str(temp_project))
+        command = Command("npm run lint", "npm", "Run lint", "")
+
+        with patch.object(
+            detector,
+            "_parse_with",
+            return_value=[{"command": "npm test"}, command, "npm run build", None],
+        ):
+            commands = detector._process_file_commands(package_json)
+
+        assert [cmd.command for cmd in commands] == ["npm test", "npm run lint"]
+        assert all(isinstance(cmd, Command) for cmd in commands)
+        assert commands[1].file == str(package_json)
+        assert commands[0].source == commands[1].source == "package.json"
+
+    @pytest.mark.unit
+    def test_scan_project_prunes_excluded_directories(self, temp_project):
+        """Test that READMEs in excluded directories are never parsed."""
+        readme = "```bash\nmake build\n```\n"
+        for directory in ("app", "node_modules/pkg", "vendor", "vendor/lib"):
+            (temp_project / directory).mkdir(parents=True, exist_ok=True)
+            (temp_project / directory / "README.md").write_text(readme)
+
+        detector = ProjectCommandDetector(
+            str(temp_project), exclude_patterns=["vendor/*"]
+        )
+        with patch.object(detector, "_process_directory_readme") as mock_process_readme:
+            detector.scan_project()
+
+        scanned = [call.args[0] for call in mock_process_readme.call_args_list]
+        assert scanned == [temp_project / "app"]
+
+    @pytest.mark.unit
+    def test_candidate_parsers_filter_by_file_name(self, temp_project):
+        """Test that pattern-based parsers are only tried for matching names."""
+        detector = ProjectCommandDetector(str(temp_project))
+
+        names = [type(p).__name__ for p in detector._candidate_parsers("package.json")]
+        assert "PackageJsonParser" in names
+        assert "MarkdownParser" not in names
+
+        names = [type(p).__name__ for p in detector._candidate_parsers("README.md")]
+        assert "MarkdownParser" in names
+        assert "PackageJsonParser" not in names
+
+        # Replacing the parser list resets the dispatch table
+        detector.parsers = []
+        assert detector._candidate_parsers("package.json") == ()
+
+    @pytest.mark.unit
+    def test_read_content_reuses_unchanged_files(self, temp_project):
+        """Test that file contents are cached until the file changes."""
+        makefile = temp_project / "Makefile"
+        makefile.write_text("build:\n\techo build\n")
+        detector = ProjectCommandDetector(str(temp_project))
+
+        content = detector._read_content(makefile)
+        assert content == b"build:\n\techo build\n"
+        assert detector._read_content(makefile) is content
+
+        makefile.write_text("build:\n\techo rebuild\n")
+        assert detector._read_content(makefile) == b"build:\n\techo rebuild\n"
+
+    @pytest.mark.unit
+    def test_scan_project_skips_symlinked_directories(self, temp_project):
+        """Test that symlinked directories are not scanned for READMEs."""
+        (temp_project / "app").mkdir()
+        (temp_project / "app" / "README.md").write_text("```bash\nmake build\n```\n")
+        (temp_project / "link").symlink_to(temp_project / "app")
+
+        detector = ProjectCommandDetector(str(temp_project))
+        with patch.object(detector, "_process_directory_readme") as mock_process_readme:
+            detector.scan_project()
+
+        scanned = [call.args[0] for call in mock_process_readme.call_args_list]
+        assert scanned == [temp_project / "app"]
+
+    @pytest.mark.unit
+    def test_generate_reports_without_commands(self, temp_project):
+        """Test that reports are still written when no command was run."""
+        detector = ProjectCommandDetector(str(temp_project))
+
+        reports = detector.generate_reports()
+
+        assert "**Total commands:** 0" in reports["todo"].read_text()
+        assert "**Total commands:** 0" in reports["done"].read_text()
+        assert reports["script"].read_text().endswith("set -e\n")
+
+    @pytest.mark.unit
+    def test_report_commands_follow_command_changes(self, temp_project):
+        """Test that reports reflect commands changed after an earlier report."""
+        detector = ProjectCommandDetector(str(temp_project))
+        detector.failed_commands.append({"command": "make test", "error": "boom"})
+        detector.generate_reports()
+
+        detector.failed_commands[0] = {"command": "make lint", "error": "bad"}
+        reports = detector.generate_reports()
+
+        assert "make lint" in reports["todo"].read_text()
+        assert "make test" not in reports["script"].read_text()
+
+    @pytest.mark.unit
+    def test_read_content_does_not_cache_large_files(self, temp_project):
+        """Test that large files are read without being kept in the cache."""
+        lockfile = temp_project / "package-lock.json"
+        lockfile.write_bytes(b"{}" + b" " * CONTENT_CACHE_MAX_FILE_SIZE)
+        detector = ProjectCommandDetector(str(temp_project))
+
+        assert detector._read_content(lockfile) == lockfile.read_bytes()
+        assert not detector._content_cache
+
+    @pytest.mark.unit
+    def test_find_parser_reuses_result_for_unchanged_files(self, temp_project):
+        """Test that parser lookups are remembered until the file changes."""
+        package_json = temp_project / "package.json"
+        package_json.write_text('{"scripts": {"test": "jest"}}')
+        detector = ProjectCommandDetector(str(temp_project))
+
+        parser = detector._find_parser(package_json, package_json.stat())
+        assert type(parser).__name__ == "PackageJsonParser"
+
+        with patch.object(type(parser), "can_parse") as mock_can_parse:
+            assert detector._find_parser(package_json, package_json.stat()) is parser
+            mock_can_parse.assert_not_called()
+
+    @pytest.mark.unit
+    def test_find_config_files_reuses_search(self, temp_project):
+        """Test that config file searches are reused until invalidated."""
+        (temp_project / "package.json").write_text('{"scripts": {"test": "jest"}}')
+        detector = ProjectCommandDetector(str(temp_project), reuse_config_files=True)
+        handler = detector.config_handler
+
+        files = detector._find_config_files()
+        assert temp_project / "package.json" in files
+
+        with patch.object(handler.file_processor, "find_files") as mock_find:
+            assert detector._find_config_files() == files
+            mock_find.assert_not_called()
+
+            handler.invalidate_scan_cache()
+            mock_find.return_value = []
+            assert detector._find_config_files() == []
+
+    @pytest.mark.unit
+    def test_find_config_files_sees_new_files_by_default(self, temp_project):
+        """Test that files added in subdirectories are found on the next scan."""
+        (temp_project / "package.json").write_text('{"scripts": {"test": "jest"}}')
+        (temp_project / "app").mkdir()
+        detector = ProjectCommandDetector(str(temp_project))
+        assert detector._find_config_files() == [temp_project / "package.json"]
+
+        (temp_project / "app" / "Makefile").write_text("build:\n\techo build\n")
+        assert temp_project / "app" / "Makefile" in detector._find_config_files()
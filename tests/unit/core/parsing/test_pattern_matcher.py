@@ -0,0 +1,89 @@
+"""
+Unit tests for compiled command patterns in PatternMatcher.
+"""
+
+import pytest
+
+from domd.core.parsing.pattern_matcher import PatternMatcher
+
+PATTERNS = [
+    "build",
+    "test*",
+    "re:^deploy",
+    "re:(a)\\1",
+    "re:(?P<word>x+)-(?P=word)",
+    "RE:Lint",
+    "re:(?i)DOCKER",
+    "re:(?x) cargo \\s+ check  # comment",
+]
+
+COMMANDS = [
+    "npm run build",
+    "npm run test:unit",
+    "npm run deploy",
+    "npm run  ",
+    "deploy --prod",
+    "make aa",
+    "make ab",
+    "echo xx-xx",
+    "echo xx-x",
+    "test -f file",
+    "Make LINT",
+    "cargo check",
+    "Docker build",
+    "echo docker",
+]
+
+
+@pytest.mark.parametrize("case_sensitive", [False, True])
+@pytest.mark.parametrize("command", COMMANDS)
+def test_compiled_patterns_match_like_match_command(command, case_sensitive):
+    """Test that compiled patterns give the same results as match_command."""
+    matcher = PatternMatcher(case_sensitive=case_sensitive)
+    regexes = matcher.compile_command_patterns(PATTERNS)
+
+    assert matcher.match_compiled_command(command, regexes) == (
+        matcher.match_command(command, PATTERNS)
+    )
+
+
+def test_compiled_patterns_keep_backreferences_separate():
+    """Test that backreferences still refer to their own pattern's groups."""
+    matcher = PatternMatcher()
+    regexes = matcher.compile_command_patterns(["re:(z)", "re:(a)\\1"])
+
+    assert len(regexes) == 2
+    assert matcher.match_compiled_command("make aa", regexes)
+    assert not matcher.match_compiled_command("make ab", regexes)
+
+
+def test_compile_command_patterns_without_usable_patterns():
+    """Test that nothing is compiled for empty or invalid patterns."""
+    matcher = PatternMatcher()
+
+    assert matcher.compile_command_patterns(["", "re:("]) is None
+
+
+def test_compiled_patterns_keep_global_flags():
+    """Test that re: patterns starting with global flags are not dropped."""
+    matcher = PatternMatcher(case_sensitive=True)
+    regexes = matcher.compile_command_patterns(["build", "re:(?i)DOCKER"])
+
+    assert len(regexes) == 2
+    assert matcher.match_compiled_command("echo Docker", regexes)
+
+
+def test_match_file_keeps_backreferences_to_own_groups():
+    """Test that file patterns with backreferences match on their own."""
+    matcher = PatternMatcher()
+
+    assert matcher.match_file("bb", ["re:(a)x", "re:(b)\\1"])
+    assert not matcher.match_file("ba", ["re:(a)x", "re:(b)\\1"])
+
+
+def test_match_file_regex_dot_does_not_match_newline():
+    """Test that the combined file patterns do not change what "." matches."""
+    matcher = PatternMatcher()
+
+    assert matcher.match_file("a-b", ["re:a.b"])
+    assert not matcher.match_file("a\nb", ["re:a.b"])
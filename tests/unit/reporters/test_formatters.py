@@ -0,0 +1,51 @@
+"""
+Tests for writing reports with the core formatters.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from domd.core.reporting.formatters import JsonFormatter, MarkdownFormatter
+
+
+@pytest.fixture
+def report_data():
+    """Report data with one failed command."""
+    return {
+        "commands": [{"command": "make test"}],
+        "failed_commands": [{"command": "make test", "error": "boom"}],
+    }
+
+
+@pytest.mark.parametrize("formatter_class", [MarkdownFormatter, JsonFormatter])
+def test_write_report_replaces_existing_report(tmp_path, report_data, formatter_class):
+    """Test that reports are written in full and no temporary file remains."""
+    output = tmp_path / "report.out"
+    output.write_text("old report")
+    formatter = formatter_class()
+
+    formatter.write_report(report_data, output, timestamp=False)
+
+    assert output.read_text(encoding="utf-8") == formatter.format_report(
+        report_data, timestamp=False
+    )
+    assert [path.name for path in tmp_path.iterdir()] == ["report.out"]
+
+
+def test_write_report_keeps_previous_report_on_error(tmp_path, report_data):
+    """Test that an interrupted write leaves the previous report untouched."""
+    output = tmp_path / "TODO.md"
+    output.write_text("old report")
+
+    def failing_lines(data, **kwargs):
+        yield "# Partial report"
+        raise RuntimeError("interrupted")
+
+    formatter = MarkdownFormatter()
+    with patch.object(formatter, "iter_report_lines", side_effect=failing_lines):
+        with pytest.raises(RuntimeError):
+            formatter.write_report(report_data, output)
+
+    assert output.read_text() == "old report"
+    assert [path.name for path in tmp_path.iterdir()] == ["TODO.md"]
@@ -0,0 +1,106 @@
+"""
+Tests for streaming TODO.md generation in the core reporter.
+"""
+
+import io
+from unittest.mock import patch
+
+import pytest
+
+from domd.core.reporters.todo_md import TodoMDReporter
+
+
+@pytest.fixture
+def failed_commands():
+    """Failed command dictionaries for testing."""
+    return [
+        {
+            "command": "make test",
+            "description": "Run tests",
+            "source": "Makefile",
+            "error": "make: command not found",
+            "return_code": 127,
+        },
+        {
+            "command": "npm run build",
+            "source": "package.json",
+            "error": "Permission denied",
+        },
+    ]
+
+
+def test_generate_report_streams_to_file(tmp_path, failed_commands):
+    """Test that write_report writes the same content generate_report returns."""
+    reporter = TodoMDReporter(tmp_path / "TODO.md")
+    data = {"failed_commands": failed_commands, "project_path": str(tmp_path)}
+
+    content = reporter.generate_report(data)
+    assert reporter.write_report(data).read_text(encoding="utf-8") == content
+    assert "### [ ] Task 2: Unnamed command" in content
+    assert content.endswith("\n---\n")
+
+
+def test_generate_report_accepts_iterators(tmp_path, failed_commands):
+    """Test that failed commands can be rendered while they are produced."""
+    reporter = TodoMDReporter()
+    data = {"failed_commands": failed_commands, "project_path": str(tmp_path)}
+    expected = reporter.generate_report(data)
+
+    stream = io.StringIO()
+    streamed = {**data, "failed_commands": iter(failed_commands)}
+    assert reporter.generate_report(streamed, stream) == ""
+    assert stream.getvalue() == expected
+
+    counted = {
+        "failed_commands": (cmd for cmd in failed_commands),
+        "failed_count": len(failed_commands),
+        "successful_count": 0,
+        "project_path": str(tmp_path),
+    }
+    assert reporter.generate_report(counted) == expected
+
+
+def test_generate_report_with_workers(tmp_path, failed_commands):
+    """Test that rendering tasks in worker processes gives the same report."""
+    reporter = TodoMDReporter()
+    data = {"failed_commands": failed_commands * 3, "project_path": str(tmp_path)}
+
+    with patch("domd.core.reporters.todo_md.now_timestamp", return_value="now"):
+        expected = reporter.generate_report(data)
+        assert reporter.generate_report(data, workers=2) == expected
+
+
+def test_write_report_skips_unchanged_data(tmp_path, failed_commands):
+    """Test that an unchanged report is not generated again."""
+    reporter = TodoMDReporter(tmp_path / "TODO.md")
+    data = {"failed_commands": failed_commands, "project_path": str(tmp_path)}
+    path = reporter.write_report(data)
+
+    with patch.object(reporter, "generate_report") as mock_generate:
+        assert reporter.write_report(data) == path
+        mock_generate.assert_not_called()
+
+        reporter.write_report(data, force=True)
+        assert mock_generate.call_count == 1
+
+    path.write_text("edited")
+    reporter.write_report(data)
+    assert "### [ ] Task 1: Run tests" in path.read_text(encoding="utf-8")
+
+
+def test_write_report_skip_is_per_reporter_configuration(tmp_path, failed_commands):
+    """Test that reporters configured differently never skip each other's writes."""
+    path = tmp_path / "TODO.md"
+    data = {"failed_commands": failed_commands, "project_path": str(tmp_path)}
+    reporter = TodoMDReporter(path)
+    reporter.write_report(data)
+
+    other = TodoMDReporter(path)
+    with patch.object(other, "generate_report") as mock_generate:
+        other.write_report(data)
+        assert mock_generate.call_count == 1
+
+    reporter.title = "Tasks"
+    with patch.object(reporter, "generate_report") as mock_generate:
+        reporter.write_report(data)
+        assert mock_generate.call_count == 1
@@ -0,0 +1,53 @@
+"""Tests for file utility functions."""
+
+import os
+import stat
+
+import pytest
+
+from domd.utils.file_utils import open_for_replace
+
+
+def test_open_for_replace_keeps_mode_and_symlink(tmp_path):
+    """Test that a symlinked file is replaced behind the link with its mode."""
+    target = tmp_path / "reports" / "TODO.md"
+    target.parent.mkdir()
+    target.write_text("old")
+    os.chmod(target, 0o640)
+    link = tmp_path / "TODO.md"
+    link.symlink_to(target)
+
+    with open_for_replace(link) as f:
+        f.write("new")
+
+    assert link.is_symlink()
+    assert target.read_text() == "new"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+    assert sorted(p.name for p in target.parent.iterdir()) == ["TODO.md"]
+
+
+def test_open_for_replace_uses_separate_temporary_files(tmp_path):
+    """Test that concurrent writers to one file do not share a temporary file."""
+    output = tmp_path / "TODO.md"
+
+    with open_for_replace(output) as first, open_for_replace(output) as second:
+        assert first.name != second.name
+        first.write("first")
+        second.write("second")
+
+    assert output.read_text() == "first"
+    assert [p.name for p in tmp_path.iterdir()] == ["TODO.md"]
+
+
+def test_open_for_replace_removes_temporary_file_on_error(tmp_path):
+    """Test that a failed write leaves the previous file untouched."""
+    output = tmp_path / "todo.sh"
+    output.write_bytes(b"old")
+
+    with pytest.raises(RuntimeError):
+        with open_for_replace(output, binary=True) as f:
+            f.write(b"partial")
+            raise RuntimeError("interrupted")
+
+    assert output.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["todo.sh"]
@@ -0,0 +1,25 @@
+"""Tests for timestamp utility functions."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from domd.utils import time_utils
+from domd.utils.time_utils import TIMESTAMP_FORMAT, now_timestamp
+
+
+def test_now_timestamp_format():
+    """Test that the timestamp parses back with the report format."""
+    parsed = datetime.strptime(now_timestamp(), TIMESTAMP_FORMAT)
+    assert abs((datetime.now() - parsed).total_seconds()) < 5
+
+
+def test_now_timestamp_reused_within_a_second():
+    """Test that the timestamp is only formatted once per second."""
+    with patch.object(time_utils.time, "time", return_value=1_700_000_000.25):
+        first = now_timestamp()
+        with patch.object(time_utils, "datetime") as mock_datetime:
+            assert now_timestamp() == first
+            mock_datetime.fromtimestamp.assert_not_called()
+
+    with patch.object(time_utils.time, "time", return_value=1_700_000_001.5):
+        assert now_timestamp() != first